@@ -20,26 +20,20 @@ def main():
     grid.set_start(0, 0)
     grid.set_end(49, 49)
 
-    print("\n" + "=" * 80)
-    print("Demonstrating A* Algorithm with Manhattan Heuristic")
-    print("=" * 80)
-    astar = AStar(grid, heuristic="manhattan")
-    animator = Animator(astar, grid, interval=30)
-    animator.animate()
-
-    print("\n" + "=" * 80)
-    print("Demonstrating Dijkstra's Algorithm")
-    print("=" * 80)
-    dijkstra = Dijkstra(grid)
-    animator = Animator(dijkstra, grid, interval=30)
-    animator.animate()
-
-    print("\n" + "=" * 80)
-    print("Demonstrating A* Algorithm with Euclidean Heuristic")
-    print("=" * 80)
-    astar_euclidean = AStar(grid, heuristic="euclidean")
-    animator = Animator(astar_euclidean, grid, interval=30)
-    animator.animate()
+    demos = [
+        ("A* Algorithm with Manhattan Heuristic", AStar(grid, heuristic="manhattan")),
+        ("Dijkstra's Algorithm", Dijkstra(grid)),
+        ("A* Algorithm with Euclidean Heuristic", AStar(grid, heuristic="euclidean")),
+    ]
+
+    # One animator reuses its figure and axes across all runs
+    animator = Animator(None, grid, interval=30)
+    for title, algorithm in demos:
+        print("\n" + "=" * 80)
+        print(f"Demonstrating {title}")
+        print("=" * 80)
+        animator.set_algorithm(algorithm)
+        animator.animate()
 
 
 if __name__ == "__main__":
@@ -30,6 +30,10 @@ setup(
         "numpy>=1.21.0",
     ],
     extras_require={
+        "fast": [
+            "numba>=0.56.0",
+            "orjson>=3.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
@@ -0,0 +1,215 @@
+"""Compiled search kernels for running pathfinding without visualization.
+
+The kernels operate on plain NumPy arrays (the grid's CSR adjacency and flat
+per-cell buffers indexed by ``row * width + col``) so that Numba can compile
+the whole search loop to machine code. Numba is an optional dependency: when
+it is not installed, ``NUMBA_AVAILABLE`` is False and callers keep using the
+interpreted implementations.
+"""
+
+import numpy as np
+
+from src.graph.node import INF_COST
+from src.utils.heuristics import (
+    chebyshev_distance_ij,
+    euclidean_distance_ij,
+    manhattan_distance_ij,
+)
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for ``numba.njit`` that leaves functions uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Compiled copies of the scalar heuristics, callable from the kernels
+_manhattan = njit(cache=True, fastmath=True)(manhattan_distance_ij)
+_euclidean = njit(cache=True, fastmath=True)(euclidean_distance_ij)
+_chebyshev = njit(cache=True, fastmath=True)(chebyshev_distance_ij)
+
+# Integer codes for the built-in heuristics understood by the kernels
+HEURISTIC_IDS: dict[str, int] = {
+    "manhattan": 0,
+    "euclidean": 1,
+    "chebyshev": 2,
+}
+
+# Heuristic code that turns astar_core into Dijkstra's algorithm
+NO_HEURISTIC = -1
+
+
+@njit(cache=True)
+def _heuristic(heuristic_id, row, col, end_row, end_col):
+    """Evaluate a built-in heuristic between two cells."""
+    if heuristic_id == NO_HEURISTIC:
+        return 0.0
+    if heuristic_id == 0:
+        return float(_manhattan(row, col, end_row, end_col))
+    if heuristic_id == 1:
+        return _euclidean(row, col, end_row, end_col)
+    return float(_chebyshev(row, col, end_row, end_col))
+
+
+@njit(cache=True)
+def _less(f_keys, g_keys, counters, i, j):
+    """Order heap slots by (f_cost, g_cost, counter), like the Python tuples."""
+    if f_keys[i] != f_keys[j]:
+        return f_keys[i] < f_keys[j]
+    if g_keys[i] != g_keys[j]:
+        return g_keys[i] < g_keys[j]
+    return counters[i] < counters[j]
+
+
+@njit(cache=True)
+def _swap(f_keys, g_keys, counters, nodes, i, j):
+    """Exchange two heap slots."""
+    f_keys[i], f_keys[j] = f_keys[j], f_keys[i]
+    g_keys[i], g_keys[j] = g_keys[j], g_keys[i]
+    counters[i], counters[j] = counters[j], counters[i]
+    nodes[i], nodes[j] = nodes[j], nodes[i]
+
+
+@njit(cache=True)
+def _siftdown(f_keys, g_keys, counters, nodes, pos):
+    """Move the slot at pos towards the root until the heap is valid."""
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        if not _less(f_keys, g_keys, counters, pos, parent):
+            break
+        _swap(f_keys, g_keys, counters, nodes, pos, parent)
+        pos = parent
+
+
+@njit(cache=True)
+def _siftup(f_keys, g_keys, counters, nodes, size):
+    """Move the root towards the leaves until the heap is valid."""
+    pos = 0
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        right = child + 1
+        if right < size and _less(f_keys, g_keys, counters, right, child):
+            child = right
+        if not _less(f_keys, g_keys, counters, child, pos):
+            break
+        _swap(f_keys, g_keys, counters, nodes, pos, child)
+        pos = child
+
+
+@njit(cache=True, fastmath=True)
+def astar_core(adj_idx, adj_cost, adj_cnt, width, start, goal, heuristic_id):
+    """
+    Run A* to completion over a grid's CSR adjacency arrays.
+
+    Args:
+        adj_idx: (N, K) int32 neighbor indices, see Grid.build_adjacency().
+        adj_cost: (N, K) movement costs matching adj_idx.
+        adj_cnt: (N,) number of neighbors per cell.
+        width: Grid width, used to recover (row, col) from flat indices.
+        start: Flat index of the start cell.
+        goal: Flat index of the goal cell.
+        heuristic_id: Code from HEURISTIC_IDS, or NO_HEURISTIC to run
+            Dijkstra's algorithm.
+
+    Returns:
+        Tuple (parent, g_cost, visited_order, visited_count, seen, found)
+        where parent holds the flat index of each cell's predecessor (-1 if
+        none), g_cost the best known cost from the start (INF_COST if
+        unreached), visited_order lists expanded cells in order, seen flags
+        every cell that entered the priority queue, and found tells whether
+        the goal was reached.
+    """
+    num_cells = adj_cnt.shape[0]
+    end_row = goal // width
+    end_col = goal - end_row * width
+
+    g_cost = np.full(num_cells, INF_COST)
+    parent = np.full(num_cells, -1, dtype=np.int32)
+    closed = np.zeros(num_cells, dtype=np.uint8)
+    seen = np.zeros(num_cells, dtype=np.uint8)
+    visited_order = np.empty(num_cells, dtype=np.int32)
+    visited_count = 0
+    best_goal = INF_COST
+
+    # Every relaxation pushes at most one entry
+    capacity = num_cells * adj_idx.shape[1] + 1
+    f_keys = np.empty(capacity, dtype=np.float64)
+    g_keys = np.empty(capacity, dtype=np.float64)
+    counters = np.empty(capacity, dtype=np.int64)
+    nodes = np.empty(capacity, dtype=np.int32)
+
+    start_row = start // width
+    g_cost[start] = 0.0
+    f_keys[0] = _heuristic(
+        heuristic_id, start_row, start - start_row * width, end_row, end_col
+    )
+    g_keys[0] = 0.0
+    counters[0] = 0
+    nodes[0] = start
+    size = 1
+    counter = 1
+    seen[start] = 1
+
+    while size > 0:
+        current = nodes[0]
+        current_g = g_keys[0]
+        size -= 1
+        if size > 0:
+            _swap(f_keys, g_keys, counters, nodes, 0, size)
+            _siftup(f_keys, g_keys, counters, nodes, size)
+
+        # Skip entries superseded by a cheaper push
+        if closed[current] or current_g > g_cost[current]:
+            continue
+
+        closed[current] = 1
+        visited_order[visited_count] = current
+        visited_count += 1
+
+        if current == goal:
+            return parent, g_cost, visited_order, visited_count, seen, True
+
+        for k in range(adj_cnt[current]):
+            neighbor = adj_idx[current, k]
+            if closed[neighbor]:
+                continue
+
+            new_g = current_g + adj_cost[current, k]
+            if new_g < g_cost[neighbor]:
+                row = neighbor // width
+                new_f = new_g + _heuristic(
+                    heuristic_id, row, neighbor - row * width, end_row, end_col
+                )
+                # Cannot lead to a cheaper path than the goal's tentative one;
+                # Dijkstra's algorithm keeps these, like its interpreted loop
+                if (
+                    new_f >= best_goal
+                    and neighbor != goal
+                    and heuristic_id != NO_HEURISTIC
+                ):
+                    continue
+
+                g_cost[neighbor] = new_g
+                parent[neighbor] = current
+                seen[neighbor] = 1
+                if neighbor == goal:
+                    best_goal = new_g
+
+                f_keys[size] = new_f
+                g_keys[size] = new_g
+                counters[size] = counter
+                nodes[size] = neighbor
+                _siftdown(f_keys, g_keys, counters, nodes, size)
+                size += 1
+                counter += 1
+
+    return parent, g_cost, visited_order, visited_count, seen, False
@@ -1,12 +1,17 @@
 """A* algorithm implementation for shortest path finding."""
 
 import heapq
+import math
+from array import array
 from typing import Callable, List, Optional
 
+import numpy as np
+
+from src.algorithms import _core
 from src.algorithms.base import PathfindingAlgorithm
 from src.graph.grid import Grid
-from src.graph.node import Node
-from src.utils.heuristics import get_heuristic, manhattan_distance
+from src.graph.node import INF_COST, Node
+from src.utils.heuristics import HEURISTICS_BATCH, HEURISTICS_IJ, get_heuristic
 
 
 class AStar(PathfindingAlgorithm):
@@ -31,6 +36,7 @@ class AStar(PathfindingAlgorithm):
         self,
         grid: Grid,
         heuristic: str | Callable[[Node, Node], float] = "manhattan",
+        bidirectional: bool = False,
     ):
         """
         Initialize A* algorithm.
@@ -39,23 +45,40 @@ class AStar(PathfindingAlgorithm):
             grid: The grid on which to perform pathfinding.
             heuristic: Heuristic function name ("manhattan", "euclidean", "chebyshev")
                       or a custom heuristic function.
+            bidirectional: If True, find_path() searches from both ends at once.
+                          Step-by-step execution is always unidirectional.
         """
         super().__init__(grid)
+        self.bidirectional = bidirectional
 
         # Set up heuristic function
         if isinstance(heuristic, str):
             self.heuristic_func = get_heuristic(heuristic)
             self.heuristic_name = heuristic
+            self._heuristic_ij = HEURISTICS_IJ[heuristic.lower()]
         else:
             self.heuristic_func = heuristic
             self.heuristic_name = "custom"
+            self._heuristic_ij = self._custom_heuristic_ij
+
+        # Heuristic values for every cell, rebuilt for each search
+        self.h_table: Optional[List[float]] = None
+
+        # Per-cell search state, indexed by row * width + col
+        self.g_costs: List[float] = []
+        # Cost of the cheapest path to the goal relaxed so far
+        self._best_goal = math.inf
 
-        self.priority_queue: List[tuple[float, float, int, Node]] = []
+        self.priority_queue: List[tuple[float, float, int, int]] = []
         self.queue_counter = 0  # For tie-breaking in priority queue
 
     def reset(self) -> None:
         """Reset the algorithm to its initial state."""
         super().reset()
+        self.h_table = None
+        num_cells = len(self._visited_bits)
+        self.g_costs = [math.inf] * num_cells
+        self._best_goal = math.inf
         self.priority_queue.clear()
         self.queue_counter = 0
 
@@ -65,20 +88,145 @@ class AStar(PathfindingAlgorithm):
         if self.is_complete:
             return
 
+        self._build_heuristic_table()
+
         # Initialize start node
         start = self.grid.start_node
-        start.g_cost = 0.0
-        start.h_cost = self._calculate_heuristic(start)
-        start.f_cost = start.g_cost + start.h_cost
-        start.cost = start.f_cost  # For compatibility
-
-        # Add to priority queue: (f_cost, g_cost, counter, node)
-        heapq.heappush(
-            self.priority_queue, (start.f_cost, start.g_cost, self.queue_counter, start)
-        )
-        self.queue_counter += 1
+        index = start.row * self._width + start.col
+        self.g_costs[index] = 0.0
+        self._push(index, self._calculate_heuristic(start), 0.0)
         self._mark_frontier(start)
 
+    def _set_costs(self, costs: List[float]) -> None:
+        """Store the compiled kernel's costs as the per-cell g_costs."""
+        self.g_costs = costs
+
+    def _store_costs(self) -> None:
+        """
+        Copy the final costs into the grid's cost, g_cost, h_cost and f_cost arrays.
+
+        h_cost and f_cost are only written for reached cells, and not at all
+        for a custom heuristic, which has no table to take them from.
+        """
+        if not self.g_costs:
+            return  # Stepped without reset(), so nothing was searched
+        arrays = self.grid.arrays
+        g_cost = np.minimum(self.g_costs, INF_COST).reshape(arrays.g_cost.shape)
+        arrays.cost[...] = g_cost
+        arrays.g_cost[...] = g_cost
+
+        end = self.grid.end_node
+        if self.heuristic_name == "custom" or end is None:
+            return
+        h_cost = self._heuristic_grid(end.row, end.col)
+        reached = g_cost < INF_COST
+        arrays.h_cost[reached] = h_cost[reached]
+        arrays.f_cost[reached] = g_cost[reached] + h_cost[reached]
+
+    def _push(self, index: int, f_cost: float, g_cost: float) -> None:
+        """
+        Add a cell to the priority queue.
+
+        Entries are tuples (f_cost, g_cost, counter, index). Older entries
+        for the same cell are left in the heap and skipped by _pop() once
+        their g_cost is worse than the cell's best known one.
+
+        Args:
+            index: Flat index of the cell to enqueue.
+            f_cost: The cell's estimated total cost.
+            g_cost: The cell's current cost from the start.
+        """
+        heapq.heappush(self.priority_queue, (f_cost, g_cost, self.queue_counter, index))
+        self.queue_counter += 1
+
+    def _pop(self) -> Optional[int]:
+        """
+        Remove and return the cell with the lowest f_cost.
+
+        Returns:
+            Flat index of the next cell to expand, or None if only
+            superseded entries remain.
+        """
+        priority_queue = self.priority_queue
+        g_costs = self.g_costs
+        while priority_queue:
+            _, g_cost, _, index = heapq.heappop(priority_queue)
+            if g_cost <= g_costs[index]:
+                return index
+        return None
+
+    def _build_heuristic_table(self) -> None:
+        """
+        Precompute the heuristic for every cell of the grid in one pass.
+
+        Built-in heuristics are evaluated with NumPy over the whole grid at
+        once, so each lookup during the search is a single index instead of
+        a Python function call. Custom heuristics are left to be called per
+        node.
+        """
+        end = self.grid.end_node
+        self.h_table = self._heuristic_table(end.row, end.col) if end else None
+
+    def _heuristic_table(
+        self, target_row: int, target_col: int
+    ) -> Optional[List[float]]:
+        """
+        Evaluate the heuristic from every cell to a target cell.
+
+        Args:
+            target_row: Row of the target cell.
+            target_col: Column of the target cell.
+
+        Returns:
+            Heuristic values indexed by row * width + col, or None for a
+            custom heuristic.
+        """
+        if self.heuristic_name == "custom":
+            return None
+
+        # A flat list indexes faster than NumPy scalars from Python code
+        return self._heuristic_grid(target_row, target_col).ravel().tolist()
+
+    def _heuristic_grid(self, target_row: int, target_col: int) -> np.ndarray:
+        """
+        Evaluate a built-in heuristic from every cell to a target cell.
+
+        Args:
+            target_row: Row of the target cell.
+            target_col: Column of the target cell.
+
+        Returns:
+            (height, width) float64 array of heuristic values.
+        """
+        batch = HEURISTICS_BATCH[self.heuristic_name.lower()]
+        table = batch(
+            np.arange(self.grid.height)[:, None],
+            np.arange(self.grid.width)[None, :],
+            target_row,
+            target_col,
+        )
+        return table.astype(np.float64)
+
+    def _custom_heuristic_ij(
+        self, row: int, col: int, end_row: int, end_col: int
+    ) -> float:
+        """
+        Adapt a Node-based custom heuristic to (row, col) arguments.
+
+        Args:
+            row: Row of the cell to estimate from.
+            col: Column of the cell to estimate from.
+            end_row: Row of the target cell.
+            end_col: Column of the target cell.
+
+        Returns:
+            The custom heuristic evaluated on the corresponding nodes.
+        """
+        nodes, width = self.grid.flat_nodes, self.grid.width
+        return self.heuristic_func(
+            nodes[row * width + col], nodes[end_row * width + end_col]
+        )
+
     def _calculate_heuristic(self, node: Node) -> float:
         """
         Calculate heuristic value for a node.
@@ -89,6 +237,8 @@ class AStar(PathfindingAlgorithm):
         Returns:
             Heuristic estimate from node to goal.
         """
+        if self.h_table is not None:
+            return self.h_table[node.row * self._width + node.col]
         if not self.grid.end_node:
             return 0.0
         return self.heuristic_func(node, self.grid.end_node)
@@ -100,33 +250,158 @@ class AStar(PathfindingAlgorithm):
         Returns:
             List of nodes forming the path, or None if no path exists.
         """
-        self.reset()
-        self.grid.reset()
+        self.reset()  # Also resets the grid
 
         if not self.grid.start_node or not self.grid.end_node:
             self.is_complete = True
             return None
 
-        # Initialize start node
-        start = self.grid.start_node
-        start.g_cost = 0.0
-        start.h_cost = self._calculate_heuristic(start)
-        start.f_cost = start.g_cost + start.h_cost
-        start.cost = start.f_cost  # For compatibility
-
-        # Add to priority queue: (f_cost, g_cost, counter, node)
-        heapq.heappush(
-            self.priority_queue, (start.f_cost, start.g_cost, self.queue_counter, start)
-        )
-        self.queue_counter += 1
-        self._mark_frontier(start)
+        if self.bidirectional:
+            return self._find_path_bidirectional()
+
+        if self._can_use_compiled_kernel():
+            return self._find_path_compiled(
+                _core.HEURISTIC_IDS[self.heuristic_name.lower()]
+            )
+
+        self.initialize()
 
         # Main algorithm loop
         while self.priority_queue:
             if not self.step():
                 break
 
-        self.is_complete = True
+        if not self.is_complete:
+            self._complete()
+        return self.path
+
+    def _can_use_compiled_kernel(self) -> bool:
+        """
+        Check whether find_path() can run in the compiled kernel.
+
+        On top of the base class conditions, the kernel only knows the
+        built-in heuristics, so it is skipped for a custom heuristic.
+
+        Returns:
+            True if the compiled kernel should be used.
+        """
+        return (
+            super()._can_use_compiled_kernel()
+            and self.heuristic_name.lower() in _core.HEURISTIC_IDS
+        )
+
+    def _find_path_bidirectional(self) -> Optional[List[Node]]:
+        """
+        Run A* from the start and from the goal until the frontiers meet.
+
+        Each iteration expands the side whose queue has the smaller f_cost;
+        the backward search estimates the distance to the start node. Queue
+        entries are (f_cost, -g_cost, counter, node) so that ties on f_cost
+        favour deeper nodes, which lets the two frontiers meet early. mu is
+        the cheapest start-goal connection seen so far, and the search stops
+        once either queue's lowest f_cost reaches mu, since no unexpanded
+        node can then lie on a cheaper path.
+
+        Returns:
+            List of nodes forming the path, or None if no path exists.
+        """
+        grid = self.grid
+        start, end = grid.start_node, grid.end_node
+        width = grid.width
+        num_cells = width * grid.height
+        flat_nodes = grid.flat_nodes
+        heuristic = self._heuristic_ij
+        visited_bits = self._visited_bits
+
+        start_index = start.row * width + start.col
+        targets = ((end.row, end.col), (start.row, start.col))
+        # Per-side heuristic tables; None for a custom heuristic
+        h_tables = tuple(self._heuristic_table(*target) for target in targets)
+        g_costs = ([math.inf] * num_cells, [math.inf] * num_cells)
+        parents = ([-1] * num_cells, [-1] * num_cells)
+        closed = (bytearray(num_cells), bytearray(num_cells))
+        queues: tuple[list, list] = ([], [])
+        counter = 0
+
+        for side, node in enumerate((start, end)):
+            index = node.row * width + node.col
+            g_costs[side][index] = 0.0
+            f_cost = heuristic(node.row, node.col, *targets[side])
+            heapq.heappush(queues[side], (f_cost, 0.0, counter, index))
+            counter += 1
+            self._mark_frontier(node)
+
+        mu = 0.0 if start is end else math.inf
+        meeting_index = start_index if start is end else -1
+
+        while queues[0] and queues[1]:
+            if max(queues[0][0][0], queues[1][0][0]) >= mu:
+                break
+
+            side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+            _, neg_g_cost, _, index = heapq.heappop(queues[side])
+            g_cost = -neg_g_cost
+            side_g = g_costs[side]
+            if closed[side][index] or g_cost > side_g[index]:
+                continue  # Superseded by a cheaper entry
+
+            closed[side][index] = 1
+            if not visited_bits[index]:
+                self._mark_visited(flat_nodes[index])
+
+            other_g = g_costs[1 - side]
+            side_closed = closed[side]
+            side_parents = parents[side]
+            side_h = h_tables[side]
+            target_row, target_col = targets[side]
+            for neighbor, edge_cost in grid.neighbors_at(index):
+                if side_closed[neighbor]:
+                    continue
+
+                new_g_cost = g_cost + edge_cost
+                if new_g_cost < side_g[neighbor]:
+                    side_g[neighbor] = new_g_cost
+                    side_parents[neighbor] = index
+
+                    # Both searches have now reached this cell
+                    if new_g_cost + other_g[neighbor] < mu:
+                        mu = new_g_cost + other_g[neighbor]
+                        meeting_index = neighbor
+
+                    if side_h is not None:
+                        f_cost = new_g_cost + side_h[neighbor]
+                    else:
+                        row, col = divmod(neighbor, width)
+                        f_cost = new_g_cost + heuristic(
+                            row, col, target_row, target_col
+                        )
+                    heapq.heappush(
+                        queues[side], (f_cost, -new_g_cost, counter, neighbor)
+                    )
+                    counter += 1
+                    if not visited_bits[neighbor]:
+                        self._mark_frontier(flat_nodes[neighbor])
+
+        if meeting_index >= 0:
+            # Forward half: parent links already point towards the start
+            parent_idx = self.parent_idx = array("i", parents[0])
+
+            # Backward half: reverse the links that point towards the goal,
+            # giving its cells their cost along the path from the start
+            forward_g, backward_g = g_costs
+            index = meeting_index
+            following = parents[1][index]
+            while following >= 0:
+                parent_idx[following] = index
+                forward_g[following] = mu - backward_g[following]
+                index = following
+                following = parents[1][index]
+
+            self.path = self._reconstruct_path(end)
+            self.is_path_found = True
+
+        self.g_costs = g_costs[0]
+        self._complete()
         return self.path
 
     def step(self) -> bool:
@@ -139,52 +414,71 @@ class AStar(PathfindingAlgorithm):
         if self.is_complete:
             return False
 
-        if not self.priority_queue:
+        # Get cell with minimum f_cost
+        index = self._pop()
+        if index is None:
             # No more nodes to explore, path not found
-            self.is_complete = True
+            self._complete()
             return False
 
-        # Get node with minimum f_cost
-        _, _, _, current = heapq.heappop(self.priority_queue)
-
-        # Skip if we've already visited this node with a better path
-        if current in self.visited_nodes:
-            return True
-
         # Mark as visited
+        flat_nodes = self.grid.flat_nodes
+        current = flat_nodes[index]
         self._mark_visited(current)
 
         # Check if we reached the goal
-        if current == self.grid.end_node:
+        end = self.grid.end_node
+        goal = end.row * self._width + end.col
+        if index == goal:
             self.path = self._reconstruct_path(current)
             self.is_path_found = True
-            self.is_complete = True
+            self._complete()
             return False
 
-        # Explore neighbors
-        for neighbor, edge_cost in self.grid.get_neighbors(current):
-            if neighbor in self.visited_nodes:
+        # Explore neighbors, with hot attributes bound to locals
+        visited_bits = self._visited_bits
+        h_table = self.h_table
+        g_costs = self.g_costs
+        parent_idx = self.parent_idx
+        priority_queue = self.priority_queue
+        heappush = heapq.heappush
+        mark_frontier = self._mark_frontier
+        counter = self.queue_counter
+        current_g = g_costs[index]
+        best_goal = self._best_goal
+        for neighbor, edge_cost in self.grid.neighbors_at(index):
+            if visited_bits[neighbor]:
                 continue
 
             # Calculate new g_cost
-            new_g_cost = current.g_cost + edge_cost
+            new_g_cost = current_g + edge_cost
 
             # Check if we found a better path to this neighbor
-            if new_g_cost < neighbor.g_cost:
-                neighbor.g_cost = new_g_cost
-                neighbor.h_cost = self._calculate_heuristic(neighbor)
-                neighbor.f_cost = neighbor.g_cost + neighbor.h_cost
-                neighbor.cost = neighbor.f_cost  # For compatibility
-                neighbor.parent = current
-
-                # Add to priority queue
-                heapq.heappush(
-                    self.priority_queue,
-                    (neighbor.f_cost, neighbor.g_cost, self.queue_counter, neighbor),
-                )
-                self.queue_counter += 1
-                self._mark_frontier(neighbor)
-
+            if new_g_cost < g_costs[neighbor]:
+                if h_table is not None:
+                    f_cost = new_g_cost + h_table[neighbor]
+                else:
+                    f_cost = new_g_cost + self._calculate_heuristic(
+                        flat_nodes[neighbor]
+                    )
+
+                # With an admissible heuristic this node cannot lead to a
+                # cheaper path than the one already reaching the goal
+                if f_cost >= best_goal and neighbor != goal:
+                    continue
+
+                g_costs[neighbor] = new_g_cost
+                parent_idx[neighbor] = index
+                if neighbor == goal:
+                    best_goal = new_g_cost
+
+                # Add to priority queue; older entries are skipped by _pop()
+                heappush(priority_queue, (f_cost, new_g_cost, counter, neighbor))
+                counter += 1
+                mark_frontier(flat_nodes[neighbor])
+
+        self.queue_counter = counter
+        self._best_goal = best_goal
         return True
 
     def get_metrics(self) -> dict:
@@ -196,5 +490,6 @@ class AStar(PathfindingAlgorithm):
         """
         metrics = super().get_metrics()
         metrics["heuristic"] = self.heuristic_name
+        metrics["bidirectional"] = self.bidirectional
         return metrics
 
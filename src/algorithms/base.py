@@ -1,10 +1,15 @@
 """Abstract base class for pathfinding algorithms."""
 
+import math
 from abc import ABC, abstractmethod
+from array import array
 from typing import Callable, List, Optional
 
+import numpy as np
+
+from src.algorithms import _core
 from src.graph.grid import Grid
-from src.graph.node import Node, NodeState
+from src.graph.node import INF_COST, Node, NodeState
 
 
 class PathfindingAlgorithm(ABC):
@@ -16,7 +21,9 @@ class PathfindingAlgorithm(ABC):
 
     Attributes:
         grid: The grid on which to perform pathfinding.
-        visited_nodes: Set of nodes that have been visited.
+        visited_nodes: Nodes that have been visited, in expansion order.
+        parent_idx: Flat index of each cell's predecessor (-1 if none),
+            indexed by row * width + col.
         path: The final path from start to end (if found).
         is_complete: Whether the algorithm has finished execution.
         is_path_found: Whether a path was found.
@@ -30,7 +37,11 @@ class PathfindingAlgorithm(ABC):
             grid: The grid on which to perform pathfinding.
         """
         self.grid = grid
-        self.visited_nodes: set[Node] = set()
+        self.visited_nodes: List[Node] = []
+        # One byte per cell, indexed by row * width + col, for O(1) membership
+        self._width = grid.width
+        self._visited_bits = bytearray(grid.width * grid.height)
+        self.parent_idx = array("i", [-1]) * (grid.width * grid.height)
         self.path: Optional[List[Node]] = None
         self.is_complete = False
         self.is_path_found = False
@@ -44,6 +55,10 @@ class PathfindingAlgorithm(ABC):
         """Reset the algorithm to its initial state."""
         self.grid.reset()
         self.visited_nodes.clear()
+        # Re-size from the current grid in case it was swapped out
+        self._width = self.grid.width
+        self._visited_bits = bytearray(self.grid.width * self.grid.height)
+        self.parent_idx = array("i", [-1]) * (self.grid.width * self.grid.height)
         self.path = None
         self.is_complete = False
         self.is_path_found = False
@@ -84,6 +99,96 @@ class PathfindingAlgorithm(ABC):
         """
         pass
 
+    def _can_use_compiled_kernel(self) -> bool:
+        """
+        Check whether find_path() can run in the compiled kernel.
+
+        The kernel reports its result only after the search finishes, so it
+        is skipped when Numba is missing or visualization callbacks are
+        attached.
+
+        Returns:
+            True if the compiled kernel should be used.
+        """
+        return (
+            _core.NUMBA_AVAILABLE
+            and self.on_node_visited is None
+            and self.on_node_explored is None
+            and self.on_path_found is None
+        )
+
+    def _find_path_compiled(self, heuristic_id: int) -> Optional[List[Node]]:
+        """
+        Run the search in the compiled kernel and mirror the result onto the grid.
+
+        Args:
+            heuristic_id: Heuristic code for _core.astar_core.
+
+        Returns:
+            List of nodes forming the path, or None if no path exists.
+        """
+        grid = self.grid
+        start, end = grid.start_node, grid.end_node
+        width = grid.width
+        if grid.adj_idx is None or grid._adjacency_dirty:
+            grid.build_adjacency()
+
+        (
+            parent,
+            g_cost,
+            visited_order,
+            visited_count,
+            seen,
+            found,
+        ) = _core.astar_core(
+            grid.adj_idx,
+            grid.adj_cost,
+            grid.adj_cnt,
+            width,
+            start.row * width + start.col,
+            end.row * width + end.col,
+            heuristic_id,
+        )
+
+        # Unreached cells hold INF_COST in the kernel and math.inf here
+        self._set_costs(np.where(g_cost < INF_COST, g_cost, math.inf).tolist())
+
+        # Replay node states so visualizations of the final grid match
+        nodes = grid.flat_nodes
+        for index in np.flatnonzero(seen).tolist():
+            self._mark_frontier(nodes[index])
+        for index in visited_order[:visited_count].tolist():
+            self._mark_visited(nodes[index])
+
+        if found:
+            self.parent_idx = array("i", parent.tobytes())
+            self.path = self._reconstruct_path(end)
+            self.is_path_found = True
+
+        self._complete()
+        return self.path
+
+    def _set_costs(self, costs: List[float]) -> None:
+        """
+        Store the per-cell costs computed by the compiled kernel.
+
+        Args:
+            costs: Cost from the start of each cell, math.inf if unreached.
+        """
+
+    def _complete(self) -> None:
+        """Mark the search as finished and publish its costs to the grid."""
+        self.is_complete = True
+        self._store_costs()
+
+    def _store_costs(self) -> None:
+        """
+        Copy the final per-cell costs into the grid's arrays.
+
+        Searches keep their costs in flat lists; this writes them to the
+        grid once at the end, so that Node cost fields report the result.
+        """
+
     def _mark_visited(self, node: Node) -> None:
         """
         Mark a node as visited and trigger callbacks.
@@ -93,7 +198,8 @@ class PathfindingAlgorithm(ABC):
         """
         if node.state not in (NodeState.START, NodeState.END, NodeState.OBSTACLE):
             node.state = NodeState.VISITED
-        self.visited_nodes.add(node)
+        self._visited_bits[node.row * self._width + node.col] = 1
+        self.visited_nodes.append(node)
 
         if self.on_node_visited:
             self.on_node_visited(node)
@@ -113,7 +219,11 @@ class PathfindingAlgorithm(ABC):
 
     def _reconstruct_path(self, end_node: Node) -> List[Node]:
         """
-        Reconstruct the path from start to end using parent pointers.
+        Reconstruct the path from start to end using parent_idx.
+
+        The chain is walked over flat indices; Node objects are only looked
+        up for the cells on the path, whose Node.parent links are set so
+        that Grid.get_path() can follow them.
 
         Args:
             end_node: The end node.
@@ -121,17 +231,28 @@ class PathfindingAlgorithm(ABC):
         Returns:
             List of nodes forming the path.
         """
-        path: List[Node] = []
-        current: Optional[Node] = end_node
-
-        while current:
-            path.append(current)
-            current = current.parent
-
-        path.reverse()
-
-        # Mark path nodes
+        parent_idx = self.parent_idx
+        end_index = end_node.row * self._width + end_node.col
+
+        # Count the chain first so the path is filled in place, start first
+        length = 1
+        index = parent_idx[end_index]
+        while index >= 0:
+            length += 1
+            index = parent_idx[index]
+
+        flat_nodes = self.grid.flat_nodes
+        path: List[Node] = [end_node] * length
+        index = end_index
+        for position in range(length - 1, -1, -1):
+            path[position] = flat_nodes[index]
+            index = parent_idx[index]
+
+        # Link and mark path nodes
+        previous: Optional[Node] = None
         for node in path:
+            node.parent = previous
+            previous = node
             if node.state not in (NodeState.START, NodeState.END):
                 node.state = NodeState.PATH
 
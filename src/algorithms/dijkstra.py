@@ -1,11 +1,20 @@
 """Dijkstra's algorithm implementation for shortest path finding."""
 
 import heapq
-from typing import List, Optional
+import math
+from typing import List, Optional, Union
 
+import numpy as np
+
+from src.algorithms import _core
 from src.algorithms.base import PathfindingAlgorithm
+from src.algorithms.queues import BucketQueue
 from src.graph.grid import Grid
-from src.graph.node import Node
+from src.graph.node import INF_COST, Node
+
+# Largest priority the BucketQueue may have to hold. It keeps one list per
+# priority value, so grids whose costs could exceed this use the heap
+_BUCKET_QUEUE_MAX_PRIORITY = 1 << 22
 
 
 class Dijkstra(PathfindingAlgorithm):
@@ -22,6 +31,11 @@ class Dijkstra(PathfindingAlgorithm):
     3. Always expanding the node with the minimum cost
     4. Continuing until the goal is reached or all reachable nodes are explored
 
+    When every edge cost is an integer (no diagonal moves, or an integer
+    diagonal cost) and path costs stay small enough to bucket, the
+    priority queue is a BucketQueue instead of a binary heap, which makes
+    queue operations O(1).
+
     Time Complexity: O((V + E) log V) where V is vertices and E is edges
     Space Complexity: O(V)
     """
@@ -34,13 +48,27 @@ class Dijkstra(PathfindingAlgorithm):
             grid: The grid on which to perform pathfinding.
         """
         super().__init__(grid)
-        self.priority_queue: List[tuple[float, int, Node]] = []
+        # Per-cell search state, indexed by row * width + col
+        self.costs: List[float] = []
+
+        self.priority_queue: Union[List[tuple[float, int, int]], BucketQueue] = []
         self.queue_counter = 0  # For tie-breaking in priority queue
 
     def reset(self) -> None:
         """Reset the algorithm to its initial state."""
         super().reset()
-        self.priority_queue.clear()
+        num_cells = len(self._visited_bits)
+        self.costs = [math.inf] * num_cells
+        grid = self.grid
+        integer_costs = (
+            not grid.allow_diagonal or float(grid.diagonal_cost).is_integer()
+        )
+        max_edge_cost = max(1.0, grid.diagonal_cost) if grid.allow_diagonal else 1.0
+        # A shortest path visits each cell at most once
+        use_buckets = (
+            integer_costs and max_edge_cost * num_cells <= _BUCKET_QUEUE_MAX_PRIORITY
+        )
+        self.priority_queue = BucketQueue() if use_buckets else []
         self.queue_counter = 0
 
     def initialize(self) -> None:
@@ -51,11 +79,70 @@ class Dijkstra(PathfindingAlgorithm):
 
         # Initialize priority queue with start node
         start = self.grid.start_node
-        start.cost = 0.0
-        heapq.heappush(self.priority_queue, (0.0, self.queue_counter, start))
-        self.queue_counter += 1
+        index = start.row * self._width + start.col
+        self.costs[index] = 0.0
+        self._push(index, 0.0)
         self._mark_frontier(start)
 
+    def _set_costs(self, costs: List[float]) -> None:
+        """Store the compiled kernel's costs as the per-cell costs."""
+        self.costs = costs
+
+    def _store_costs(self) -> None:
+        """Copy the final costs into the grid's cost, g_cost and f_cost arrays."""
+        if not self.costs:
+            return  # Stepped without reset(), so nothing was searched
+        arrays = self.grid.arrays
+        costs = np.minimum(self.costs, INF_COST).reshape(arrays.cost.shape)
+        arrays.cost[...] = costs
+        arrays.g_cost[...] = costs
+        arrays.f_cost[...] = costs
+
+    def _push(self, index: int, cost: float) -> None:
+        """
+        Add a cell to the priority queue.
+
+        Heap entries are tuples (cost, counter, index); a BucketQueue keeps
+        equal costs in insertion order by itself. Older entries for the
+        same cell are left in the queue and skipped by _pop() once their
+        cost is worse than the cell's best known one.
+
+        Args:
+            index: Flat index of the cell to enqueue.
+            cost: The cell's current cost from the start.
+        """
+        if isinstance(self.priority_queue, BucketQueue):
+            self.priority_queue.push(int(cost), index)
+        else:
+            heapq.heappush(self.priority_queue, (cost, self.queue_counter, index))
+        self.queue_counter += 1
+
+    def _pop(self) -> Optional[int]:
+        """
+        Remove and return the cell with the lowest cost.
+
+        Returns:
+            Flat index of the next cell to expand, or None if only
+            superseded entries remain.
+        """
+        priority_queue = self.priority_queue
+        costs = self.costs
+        if isinstance(priority_queue, BucketQueue):
+            # Skip BucketQueue.__len__ calls by letting pop() signal the end
+            while True:
+                try:
+                    cost, index = priority_queue.pop()
+                except IndexError:
+                    return None
+                if cost <= costs[index]:
+                    return index
+
+        while priority_queue:
+            cost, _, index = heapq.heappop(priority_queue)
+            if cost <= costs[index]:
+                return index
+        return None
+
     def find_path(self) -> Optional[List[Node]]:
         """
         Find the shortest path from start to end using Dijkstra's algorithm.
@@ -63,26 +150,21 @@ class Dijkstra(PathfindingAlgorithm):
         Returns:
             List of nodes forming the path, or None if no path exists.
         """
-        self.reset()
-        self.grid.reset()
+        self.reset()  # Also resets the grid
 
         if not self.grid.start_node or not self.grid.end_node:
             self.is_complete = True
             return None
 
-        # Initialize priority queue with start node
-        start = self.grid.start_node
-        start.cost = 0.0
-        heapq.heappush(self.priority_queue, (0.0, self.queue_counter, start))
-        self.queue_counter += 1
-        self._mark_frontier(start)
+        if self._can_use_compiled_kernel():
+            return self._find_path_compiled(_core.NO_HEURISTIC)
 
-        # Main algorithm loop
-        while self.priority_queue:
-            if not self.step():
-                break
+        self.initialize()
+
+        # Main algorithm loop; step() returns False once the queue runs dry
+        while self.step():
+            pass
 
-        self.is_complete = True
         return self.path
 
     def step(self) -> bool:
@@ -95,45 +177,57 @@ class Dijkstra(PathfindingAlgorithm):
         if self.is_complete:
             return False
 
-        if not self.priority_queue:
+        # Get cell with minimum cost
+        index = self._pop()
+        if index is None:
             # No more nodes to explore, path not found
-            self.is_complete = True
+            self._complete()
             return False
 
-        # Get node with minimum cost
-        current_cost, _, current = heapq.heappop(self.priority_queue)
-
-        # Skip if we've already found a better path to this node
-        if current in self.visited_nodes:
-            return True
-
         # Mark as visited
+        flat_nodes = self.grid.flat_nodes
+        current = flat_nodes[index]
         self._mark_visited(current)
 
         # Check if we reached the goal
-        if current == self.grid.end_node:
+        end = self.grid.end_node
+        goal = end.row * self._width + end.col
+        if index == goal:
             self.path = self._reconstruct_path(current)
             self.is_path_found = True
-            self.is_complete = True
+            self._complete()
             return False
 
-        # Explore neighbors
-        for neighbor, edge_cost in self.grid.get_neighbors(current):
-            if neighbor in self.visited_nodes:
+        # Explore neighbors, with hot attributes bound to locals
+        visited_bits = self._visited_bits
+        costs = self.costs
+        parent_idx = self.parent_idx
+        priority_queue = self.priority_queue
+        bucketed = isinstance(priority_queue, BucketQueue)
+        bucket_push = priority_queue.push if bucketed else None
+        heappush = heapq.heappush
+        mark_frontier = self._mark_frontier
+        counter = self.queue_counter
+        current_cost = costs[index]
+        for neighbor, edge_cost in self.grid.neighbors_at(index):
+            if visited_bits[neighbor]:
                 continue
 
             # Calculate new cost
-            new_cost = current.cost + edge_cost
+            new_cost = current_cost + edge_cost
 
             # If we found a better path, update it
-            if new_cost < neighbor.cost:
-                neighbor.cost = new_cost
-                neighbor.parent = current
-                heapq.heappush(
-                    self.priority_queue, (new_cost, self.queue_counter, neighbor)
-                )
-                self.queue_counter += 1
-                self._mark_frontier(neighbor)
-
+            if new_cost < costs[neighbor]:
+                costs[neighbor] = new_cost
+                parent_idx[neighbor] = index
+
+                # Add to priority queue; older entries are skipped by _pop()
+                if bucketed:
+                    bucket_push(int(new_cost), neighbor)
+                else:
+                    heappush(priority_queue, (new_cost, counter, neighbor))
+                counter += 1
+                mark_frontier(flat_nodes[neighbor])
+
+        self.queue_counter = counter
         return True
-
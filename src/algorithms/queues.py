@@ -0,0 +1,80 @@
+"""Priority queues specialized for the search loops."""
+
+from typing import List, Tuple
+
+
+class BucketQueue:
+    """
+    Monotone priority queue for non-negative integer priorities.
+
+    Items are kept in one list per priority value, so push and pop take
+    O(1) time instead of the O(log n) of a binary heap. Items with equal
+    priority are popped in insertion order, which matches a heap of
+    (priority, counter, item) tuples.
+
+    The queue is monotone: pop() always returns the lowest priority, and
+    items must never be pushed with a priority lower than the last popped
+    one. Dijkstra's algorithm with non-negative integer edge costs
+    satisfies this.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty queue."""
+        self._buckets: List[List[int]] = []
+        self._current = 0  # Lowest priority that may hold items
+        self._head = 0  # Read position within the current bucket
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of items in the queue."""
+        return self._size
+
+    def push(self, priority: int, item: int) -> None:
+        """
+        Add an item to the queue.
+
+        Args:
+            priority: Priority of the item, not lower than the last popped one.
+            item: The item to enqueue.
+        """
+        buckets = self._buckets
+        if priority >= len(buckets):
+            buckets.extend([] for _ in range(priority + 1 - len(buckets)))
+        buckets[priority].append(item)
+        self._size += 1
+
+    def pop(self) -> Tuple[int, int]:
+        """
+        Remove and return the item with the lowest priority.
+
+        Returns:
+            Tuple (priority, item).
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        if not self._size:
+            raise IndexError("pop from an empty BucketQueue")
+
+        buckets = self._buckets
+        current = self._current
+        bucket = buckets[current]
+        while self._head >= len(bucket):
+            # Drop the exhausted bucket's items and move to the next one
+            bucket.clear()
+            current += 1
+            bucket = buckets[current]
+            self._head = 0
+        self._current = current
+
+        item = bucket[self._head]
+        self._head += 1
+        self._size -= 1
+        return current, item
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._buckets.clear()
+        self._current = 0
+        self._head = 0
+        self._size = 0
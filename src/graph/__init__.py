@@ -1,7 +1,7 @@
 """Graph data structures for pathfinding."""
 
 from src.graph.grid import Grid
-from src.graph.node import Node, NodeState
+from src.graph.node import INF_COST, STATE_CODES, GridArrays, Node, NodeState
 
-__all__ = ["Grid", "Node", "NodeState"]
+__all__ = ["Grid", "GridArrays", "Node", "NodeState", "STATE_CODES", "INF_COST"]
 
@@ -1,9 +1,24 @@
 """Grid-based graph representation for pathfinding algorithms."""
 
-import random
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
-from src.graph.node import Node, NodeState
+import numpy as np
+
+from src.graph.node import (
+    INF_COST,
+    STATE_CODES,
+    FlatNodes,
+    GridArrays,
+    Node,
+    NodeRows,
+    NodeState,
+)
+
+# Neighbor offsets, in the order get_neighbors() reports them
+_ORTHOGONAL_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_DIAGONAL_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+_OBSTACLE_CODE = STATE_CODES[NodeState.OBSTACLE]
 
 
 class Grid:
@@ -17,9 +32,19 @@ class Grid:
         width: Number of columns in the grid.
         height: Number of rows in the grid.
         allow_diagonal: Whether diagonal movement is allowed.
-        nodes: 2D array of Node objects.
+        arrays: Per-cell node data; Node objects are views into it.
+        nodes: Node objects indexed by [row][col]; each row is built on
+            first access.
+        flat_nodes: The nodes indexed by row * width + col; each Node view
+            is created the first time it is accessed.
+        state_array: Read-only (height, width) uint8 view of every node's
+            state as a NodeState code.
+        obstacle_mask: (height, width) boolean array of obstacle cells.
         start_node: Starting node for pathfinding.
         end_node: Goal node for pathfinding.
+        adj_idx: (H*W, K) int32 array of neighbor flat indices, -1 padded.
+        adj_cost: (H*W, K) array of movement costs matching adj_idx.
+        adj_cnt: (H*W,) int32 array with the number of neighbors per cell.
     """
 
     def __init__(
@@ -46,14 +71,51 @@ class Grid:
         self.allow_diagonal = allow_diagonal
         self.diagonal_cost = diagonal_cost
 
-        # Create 2D array of nodes
-        self.nodes: List[List[Node]] = [
-            [Node(row, col) for col in range(width)] for row in range(height)
-        ]
+        # Per-cell data, with Node views created only for the cells in use
+        self.arrays = GridArrays(height, width)
+        self.flat_nodes = FlatNodes(self.arrays)
+        self.nodes = NodeRows(self.arrays.nodes, height, width)
 
         self.start_node: Optional[Node] = None
         self.end_node: Optional[Node] = None
 
+        self.state_array = self.arrays.state.view()
+        self.state_array.flags.writeable = False
+
+        # CSR-style adjacency, built lazily and invalidated by obstacle edits
+        self.adj_idx: Optional[np.ndarray] = None
+        self.adj_cost: Optional[np.ndarray] = None
+        self.adj_cnt: Optional[np.ndarray] = None
+        self._adjacency: List[Optional[List[Tuple[int, float]]]] = []
+        self._adjacency_dirty = True
+
+        # Obstacle layout the adjacency was built from, to catch obstacles
+        # set through Node objects rather than the Grid methods
+        self._adjacency_obstacles: Optional[np.ndarray] = None
+
+        # Obstacle positions, built lazily and invalidated by obstacle edits
+        self._obstacle_coords: Optional[Tuple[Tuple[int, int], ...]] = None
+
+    @property
+    def allow_diagonal(self) -> bool:
+        """Whether diagonal movement is allowed."""
+        return self._allow_diagonal
+
+    @allow_diagonal.setter
+    def allow_diagonal(self, value: bool) -> None:
+        self._allow_diagonal = value
+        self._adjacency_dirty = True
+
+    @property
+    def diagonal_cost(self) -> float:
+        """Cost of diagonal movement."""
+        return self._diagonal_cost
+
+    @diagonal_cost.setter
+    def diagonal_cost(self, value: float) -> None:
+        self._diagonal_cost = value
+        self._adjacency_dirty = True
+
     def get_node(self, row: int, col: int) -> Optional[Node]:
         """
         Get a node at the specified position.
@@ -66,7 +128,7 @@ class Grid:
             Node at the position, or None if out of bounds.
         """
         if 0 <= row < self.height and 0 <= col < self.width:
-            return self.nodes[row][col]
+            return self.flat_nodes[row * self.width + col]
         return None
 
     def is_valid_position(self, row: int, col: int) -> bool:
@@ -94,24 +156,158 @@ class Grid:
         """
         neighbors: List[Tuple[Node, float]] = []
         row, col = node.row, node.col
+        width, height = self.width, self.height
+        states = self.arrays.state_buffer
 
         # Orthogonal neighbors (up, down, left, right)
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        for dr, dc in directions:
+        for dr, dc in _ORTHOGONAL_DIRECTIONS:
             new_row, new_col = row + dr, col + dc
-            neighbor = self.get_node(new_row, new_col)
-            if neighbor and neighbor.is_traversable():
-                neighbors.append((neighbor, 1.0))
+            if (
+                0 <= new_row < height
+                and 0 <= new_col < width
+                and states[new_row * width + new_col] != _OBSTACLE_CODE
+            ):
+                neighbors.append((self.flat_nodes[new_row * width + new_col], 1.0))
 
         # Diagonal neighbors (if allowed)
         if self.allow_diagonal:
-            diagonal_directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-            for dr, dc in diagonal_directions:
+            for dr, dc in _DIAGONAL_DIRECTIONS:
                 new_row, new_col = row + dr, col + dc
-                neighbor = self.get_node(new_row, new_col)
-                if neighbor and neighbor.is_traversable():
-                    neighbors.append((neighbor, self.diagonal_cost))
+                if (
+                    0 <= new_row < height
+                    and 0 <= new_col < width
+                    and states[new_row * width + new_col] != _OBSTACLE_CODE
+                ):
+                    neighbors.append(
+                        (self.flat_nodes[new_row * width + new_col], self.diagonal_cost)
+                    )
+
+        return neighbors
+
+    def edge_cost(self, from_node: Node, to_node: Node) -> Optional[float]:
+        """
+        Get the cost of moving directly between two cells.
+
+        Equivalent to looking to_node up in get_neighbors(from_node), without
+        enumerating the neighbors.
+
+        Args:
+            from_node: The node to move from.
+            to_node: The node to move to.
+
+        Returns:
+            The movement cost, or None if to_node is not a traversable
+            neighbor of from_node.
+        """
+        dr = abs(to_node.row - from_node.row)
+        dc = abs(to_node.col - from_node.col)
+        if dr > 1 or dc > 1 or dr + dc == 0:
+            return None
+        if not self.is_valid_position(to_node.row, to_node.col):
+            return None
+        if not to_node.is_traversable():
+            return None
+        if dr + dc == 1:
+            return 1.0
+        return self.diagonal_cost if self.allow_diagonal else None
+
+    @property
+    def obstacle_mask(self) -> np.ndarray:
+        """(height, width) boolean array marking obstacle cells."""
+        return self.state_array == NodeState.OBSTACLE
+
+    @property
+    def obstacle_coords(self) -> Tuple[Tuple[int, int], ...]:
+        """(row, col) of every obstacle in row-major order, cached between edits."""
+        if self._obstacle_coords is None:
+            self._obstacle_coords = tuple(
+                map(tuple, np.argwhere(self.obstacle_mask).tolist())
+            )
+        return self._obstacle_coords
+
+    @property
+    def obstacle_count(self) -> int:
+        """Number of obstacle cells."""
+        return len(self.obstacle_coords)
+
+    def _obstacles_changed(self) -> None:
+        """Invalidate everything derived from the obstacle layout."""
+        self._adjacency_dirty = True
+        self._obstacle_coords = None
+
+    def build_adjacency(self) -> None:
+        """
+        Precompute the traversable neighbors of every cell.
+
+        Fills adj_idx, adj_cost and adj_cnt in one vectorized pass per
+        direction, using the same neighbor order as get_neighbors(). The
+        per-cell (index, cost) lists used by the interpreted algorithms are
+        materialized on first access by neighbors_at().
+        """
+        height, width = self.height, self.width
+        num_cells = height * width
+
+        directions = [(dr, dc, 1.0) for dr, dc in _ORTHOGONAL_DIRECTIONS]
+        if self.allow_diagonal:
+            directions += [
+                (dr, dc, self.diagonal_cost) for dr, dc in _DIAGONAL_DIRECTIONS
+            ]
+
+        traversable = ~self.obstacle_mask.ravel()
+        rows, cols = np.divmod(np.arange(num_cells), width)
+
+        self.adj_idx = np.full((num_cells, len(directions)), -1, dtype=np.int32)
+        self.adj_cost = np.zeros((num_cells, len(directions)), dtype=np.float64)
+        self.adj_cnt = np.zeros(num_cells, dtype=np.int32)
+
+        for dr, dc, cost in directions:
+            new_rows = rows + dr
+            new_cols = cols + dc
+            valid = (
+                (new_rows >= 0)
+                & (new_rows < height)
+                & (new_cols >= 0)
+                & (new_cols < width)
+            )
+            cells = np.flatnonzero(valid)
+            neighbors = new_rows[cells] * width + new_cols[cells]
+            keep = traversable[neighbors]
+            cells = cells[keep]
+            slots = self.adj_cnt[cells]
+            self.adj_idx[cells, slots] = neighbors[keep]
+            self.adj_cost[cells, slots] = cost
+            self.adj_cnt[cells] += 1
+
+        self._adjacency = [None] * num_cells
+        self._adjacency_obstacles = ~traversable
+        self._adjacency_dirty = False
+
+    def neighbors_at(self, index: int) -> List[Tuple[int, float]]:
+        """
+        Get the cached neighbors of the cell at a flat index.
 
+        Unlike get_neighbors(), neighbors are returned as flat indices and
+        the returned list is shared between calls and must not be modified.
+
+        Args:
+            index: Flat cell index (row * width + col).
+
+        Returns:
+            List of tuples (neighbor_index, movement_cost).
+        """
+        if self._adjacency_dirty:
+            self.build_adjacency()
+
+        neighbors = self._adjacency[index]
+        if neighbors is None:
+            count = int(self.adj_cnt[index])
+            neighbors = list(
+                zip(
+                    self.adj_idx[index, :count].tolist(),
+                    self.adj_cost[index, :count].tolist(),
+                )
+            )
+            self._adjacency[index] = neighbors
         return neighbors
 
     def set_start(self, row: int, col: int) -> bool:
@@ -170,9 +366,33 @@ class Grid:
         node = self.get_node(row, col)
         if node:
             node.set_obstacle(True)
+            self._obstacles_changed()
             return True
         return False
 
+    def add_obstacles(self, positions: Sequence[Sequence[int]]) -> int:
+        """
+        Add obstacles at many positions at once.
+
+        Same effect as calling add_obstacle() for each position, but done
+        with one array operation instead of a node lookup per position.
+
+        Args:
+            positions: (row, col) pairs; out-of-bounds positions are skipped.
+
+        Returns:
+            Number of positions that were inside the grid.
+        """
+        coords = np.asarray(positions, dtype=np.intp).reshape(-1, 2)
+        rows, cols = coords[:, 0], coords[:, 1]
+        valid = (rows >= 0) & (rows < self.height) & (cols >= 0) & (cols < self.width)
+        rows, cols = rows[valid], cols[valid]
+        self.arrays.state[rows, cols] = NodeState.OBSTACLE
+        self.arrays.cost[rows, cols] = INF_COST
+        if rows.size:
+            self._obstacles_changed()
+        return int(rows.size)
+
     def remove_obstacle(self, row: int, col: int) -> bool:
         """
         Remove an obstacle at the specified position.
@@ -187,15 +407,19 @@ class Grid:
         node = self.get_node(row, col)
         if node:
             node.set_obstacle(False)
+            self._obstacles_changed()
             return True
         return False
 
-    def add_obstacles_random(self, density: float = 0.3) -> None:
+    def add_obstacles_random(
+        self, density: float = 0.3, seed: Optional[int] = None
+    ) -> None:
         """
         Randomly place obstacles in the grid.
 
         Args:
             density: Fraction of cells to fill with obstacles (0.0 to 1.0).
+            seed: Optional seed for reproducible obstacle layouts.
         """
         if not 0.0 <= density <= 1.0:
             raise ValueError("Density must be between 0.0 and 1.0")
@@ -204,39 +428,87 @@ class Grid:
         num_obstacles = int(total_cells * density)
 
         # Exclude start and end positions from obstacle placement
-        excluded_positions = set()
+        excluded = np.zeros(total_cells, dtype=bool)
         if self.start_node:
-            excluded_positions.add((self.start_node.row, self.start_node.col))
+            excluded[self.start_node.row * self.width + self.start_node.col] = True
         if self.end_node:
-            excluded_positions.add((self.end_node.row, self.end_node.col))
-
-        available_positions = [
-            (r, c)
-            for r in range(self.height)
-            for c in range(self.width)
-            if (r, c) not in excluded_positions
-        ]
-
-        random.shuffle(available_positions)
-        for i in range(min(num_obstacles, len(available_positions))):
-            row, col = available_positions[i]
-            self.add_obstacle(row, col)
+            excluded[self.end_node.row * self.width + self.end_node.col] = True
+
+        # Generator.choice samples without permuting the whole pool
+        available = np.flatnonzero(~excluded)
+        picks = np.random.default_rng(seed).choice(
+            available, size=min(num_obstacles, available.size), replace=False
+        )
+        # Same effect as add_obstacle() on each pick, for all picks at once
+        self.arrays.state.ravel()[picks] = NodeState.OBSTACLE
+        self.arrays.cost.ravel()[picks] = INF_COST
+        self._obstacles_changed()
 
     def clear_obstacles(self) -> None:
         """Remove all obstacles from the grid."""
-        for row in self.nodes:
-            for node in row:
-                if node.state == NodeState.OBSTACLE:
-                    node.set_obstacle(False)
+        obstacles = self.arrays.state == NodeState.OBSTACLE
+        self.arrays.state[obstacles] = NodeState.UNVISITED
+        self.arrays.cost[obstacles] = INF_COST
+        self._obstacles_changed()
+
+    def clone_from(self, other: "Grid") -> None:
+        """
+        Copy another grid's configuration onto this grid in place.
+
+        The state buffer is copied in one operation and then reset, so this
+        grid ends up with the other grid's movement rules, obstacles, start
+        and end, and every other cell unvisited.
+
+        Args:
+            other: Grid to copy; must have the same dimensions.
+
+        Raises:
+            ValueError: If the grids have different dimensions.
+        """
+        if (self.width, self.height) != (other.width, other.height):
+            raise ValueError("Grids must have the same dimensions")
+
+        self.allow_diagonal = other.allow_diagonal
+        self.diagonal_cost = other.diagonal_cost
+        np.copyto(self.arrays.state, other.arrays.state)
+        self.arrays.reset()
+        self._obstacles_changed()
+
+        self.start_node = None
+        self.end_node = None
+        if other.start_node:
+            self.set_start(other.start_node.row, other.start_node.col)
+        if other.end_node:
+            self.set_end(other.end_node.row, other.end_node.col)
+
+    def clone(self) -> "Grid":
+        """
+        Create a copy of the grid's configuration.
+
+        The copy has the same dimensions, movement rules, obstacles, start
+        and end; all other cells are unvisited. See clone_from().
+
+        Returns:
+            A new Grid instance with identical configuration.
+        """
+        new_grid = Grid(
+            self.width, self.height, self.allow_diagonal, self.diagonal_cost
+        )
+        new_grid.clone_from(self)
+        return new_grid
 
     def reset(self) -> None:
         """Reset all nodes to their initial state (preserves obstacles and start/end)."""
+        # Obstacles set through Node objects bypass _obstacles_changed()
+        if not self._adjacency_dirty and not np.array_equal(
+            self.obstacle_mask.ravel(), self._adjacency_obstacles
+        ):
+            self._obstacles_changed()
+
         start_pos = (self.start_node.row, self.start_node.col) if self.start_node else None
         end_pos = (self.end_node.row, self.end_node.col) if self.end_node else None
 
-        for row in self.nodes:
-            for node in row:
-                node.reset()
+        self.arrays.reset()
 
         if start_pos:
             self.set_start(start_pos[0], start_pos[1])
@@ -253,14 +525,22 @@ class Grid:
         if not self.end_node or not self.end_node.parent:
             return None
 
-        path: List[Node] = []
-        current = self.end_node
+        # Follow the int32 parent links; Nodes are looked up only for the path
+        parents = self.arrays.parent_buffer
+        index = self.end_node.row * self.width + self.end_node.col
+        indices: List[int] = []
+        while index >= 0:
+            indices.append(index)
+            index = parents[index]
+
+        flat_nodes = self.flat_nodes
+        path = [flat_nodes[index] for index in reversed(indices)]
 
+        # A parent outside this grid is linked by reference; follow it too
+        current = path[0].parent
         while current:
-            path.append(current)
+            path.insert(0, current)
             current = current.parent
-
-        path.reverse()
         return path
 
     def __repr__(self) -> str:
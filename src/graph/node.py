@@ -1,19 +1,110 @@
 """Node class for representing grid cells in pathfinding algorithms."""
 
-from enum import Enum
-from typing import Optional
+import math
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Dict, Iterator, List, Optional, Union
 
+import numpy as np
 
-class NodeState(Enum):
-    """State of a node during pathfinding."""
 
-    UNVISITED = "unvisited"
-    VISITED = "visited"
-    FRONTIER = "frontier"
-    PATH = "path"
-    OBSTACLE = "obstacle"
-    START = "start"
-    END = "end"
+class NodeState(IntEnum):
+    """State of a node during pathfinding, stored as a uint8 code."""
+
+    UNVISITED = 0
+    VISITED = 1
+    FRONTIER = 2
+    PATH = 3
+    OBSTACLE = 4
+    START = 5
+    END = 6
+
+
+# Code of each state, as stored in GridArrays.state and Grid.state_array
+STATE_CODES: dict[NodeState, int] = {state: int(state) for state in NodeState}
+
+# NodeState for each code, for fast lookups from Python
+_STATES = tuple(NodeState)
+
+# Plain int code of obstacles; comparing ints is cheaper than IntEnum members
+_OBSTACLE_CODE = STATE_CODES[NodeState.OBSTACLE]
+
+# Module-level aliases spare the NodeState attribute lookup in Node methods
+_UNVISITED = NodeState.UNVISITED
+_OBSTACLE = NodeState.OBSTACLE
+
+# Cost of unreached cells: the largest float32, a finite stand-in for
+# infinity that keeps compiled code free of inf/NaN special cases. It only
+# lives in the buffers; Node properties report it as math.inf.
+INF_COST = float(np.finfo(np.float32).max)
+
+# Parent marker for a parent node that lives outside the node's own arrays
+_FOREIGN_PARENT = -2
+
+
+@dataclass
+class GridArrays:
+    """
+    Per-cell node data stored as parallel arrays (structure of arrays).
+
+    Every array has shape (height, width) and is indexed by [row, col], or
+    by row * width + col through the flat buffers it is a view of. The
+    NumPy views serve bulk operations such as reset(); Node objects read
+    and write single cells through the buffers, which is faster from
+    Python than indexing NumPy arrays.
+
+    Attributes:
+        height: Number of rows.
+        width: Number of columns.
+        state: uint8 NodeState code of each cell.
+        cost: Cost to reach each cell from the start.
+        g_cost: Actual cost from start to each cell (for A*).
+        h_cost: Heuristic cost from each cell to the goal (for A*).
+        f_cost: Total estimated cost (g + h) of each cell (for A*).
+        parent: int32 flat index of each cell's parent, -1 if none.
+        nodes: Node views of the cells, keyed by row * width + col and
+            created on first access.
+    """
+
+    height: int
+    width: int
+    state: np.ndarray = field(init=False, repr=False)
+    cost: np.ndarray = field(init=False, repr=False)
+    g_cost: np.ndarray = field(init=False, repr=False)
+    h_cost: np.ndarray = field(init=False, repr=False)
+    f_cost: np.ndarray = field(init=False, repr=False)
+    parent: np.ndarray = field(init=False, repr=False)
+    nodes: Dict[int, "Node"] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Allocate the buffers and their NumPy views."""
+        num_cells = self.height * self.width
+        self.state_buffer = bytearray(num_cells)
+        self.cost_buffer = array("d", [INF_COST]) * num_cells
+        self.g_cost_buffer = array("d", [INF_COST]) * num_cells
+        self.h_cost_buffer = array("d", [0.0]) * num_cells
+        self.f_cost_buffer = array("d", [INF_COST]) * num_cells
+        self.parent_buffer = array("i", [-1]) * num_cells
+
+        shape = (self.height, self.width)
+        self.state = np.frombuffer(self.state_buffer, dtype=np.uint8).reshape(shape)
+        self.cost = np.frombuffer(self.cost_buffer).reshape(shape)
+        self.g_cost = np.frombuffer(self.g_cost_buffer).reshape(shape)
+        self.h_cost = np.frombuffer(self.h_cost_buffer).reshape(shape)
+        self.f_cost = np.frombuffer(self.f_cost_buffer).reshape(shape)
+        self.parent = np.frombuffer(self.parent_buffer, dtype=np.int32).reshape(shape)
+        self.nodes = _NodeCache(self)
+
+    def reset(self) -> None:
+        """Reset every cell like Node.reset(), keeping obstacles."""
+        self.state[self.state != NodeState.OBSTACLE] = NodeState.UNVISITED
+        self.cost.fill(INF_COST)
+        self.g_cost.fill(INF_COST)
+        self.h_cost.fill(0.0)
+        self.f_cost.fill(INF_COST)
+        self.parent.fill(-1)
 
 
 class Node:
@@ -21,6 +112,9 @@ class Node:
     Represents a single node (cell) in a grid-based graph.
 
     Each node tracks its position, state, cost, and parent for path reconstruction.
+    A node is a view of one cell of a GridArrays; its data lives in the
+    arrays, so grids can update all cells at once. A node created on its
+    own gets private 1x1 arrays.
 
     Attributes:
         row: Row index in the grid.
@@ -33,7 +127,16 @@ class Node:
         f_cost: Total estimated cost (g + h) for A*.
     """
 
-    def __init__(self, row: int, col: int, is_obstacle: bool = False):
+    # Grids hold one Node per cell, so avoid a per-instance __dict__
+    __slots__ = ("row", "col", "_arrays", "_index", "_foreign_parent", "_hash")
+
+    def __init__(
+        self,
+        row: int,
+        col: int,
+        is_obstacle: bool = False,
+        arrays: Optional[GridArrays] = None,
+    ):
         """
         Initialize a node.
 
@@ -41,47 +144,118 @@ class Node:
             row: Row index in the grid.
             col: Column index in the grid.
             is_obstacle: Whether this node is an obstacle.
+            arrays: Grid arrays holding this node's data. If None, the node
+                   gets its own single-cell arrays.
         """
         self.row = row
         self.col = col
-        self.state = NodeState.OBSTACLE if is_obstacle else NodeState.UNVISITED
-        self.cost = float("inf")
-        self.parent: Optional["Node"] = None
+        self._hash = hash((row, col))
+        self._foreign_parent: Optional["Node"] = None
+        if arrays is None:
+            arrays = GridArrays(1, 1)
+            arrays.nodes[0] = self
+            self._index = 0
+        else:
+            self._index = row * arrays.width + col
+        self._arrays = arrays
+        if is_obstacle:
+            self.state = NodeState.OBSTACLE
+
+    @property
+    def state(self) -> NodeState:
+        """Current state of the node."""
+        return _STATES[self._arrays.state_buffer[self._index]]
+
+    @state.setter
+    def state(self, value: NodeState) -> None:
+        self._arrays.state_buffer[self._index] = value
+
+    @property
+    def cost(self) -> float:
+        """Cost to reach this node from the start."""
+        value = self._arrays.cost_buffer[self._index]
+        return value if value < INF_COST else math.inf
+
+    @cost.setter
+    def cost(self, value: float) -> None:
+        self._arrays.cost_buffer[self._index] = min(value, INF_COST)
+
+    @property
+    def g_cost(self) -> float:
+        """Actual cost from start to this node (for A*)."""
+        value = self._arrays.g_cost_buffer[self._index]
+        return value if value < INF_COST else math.inf
+
+    @g_cost.setter
+    def g_cost(self, value: float) -> None:
+        self._arrays.g_cost_buffer[self._index] = min(value, INF_COST)
+
+    @property
+    def h_cost(self) -> float:
+        """Heuristic cost from this node to goal (for A*)."""
+        return self._arrays.h_cost_buffer[self._index]
 
-        # A* specific attributes
-        self.g_cost = float("inf")  # Actual cost from start
-        self.h_cost = 0.0  # Heuristic cost to goal
-        self.f_cost = float("inf")  # Total estimated cost (g + h)
+    @h_cost.setter
+    def h_cost(self, value: float) -> None:
+        self._arrays.h_cost_buffer[self._index] = value
+
+    @property
+    def f_cost(self) -> float:
+        """Total estimated cost (g + h) for A*."""
+        value = self._arrays.f_cost_buffer[self._index]
+        return value if value < INF_COST else math.inf
+
+    @f_cost.setter
+    def f_cost(self, value: float) -> None:
+        self._arrays.f_cost_buffer[self._index] = min(value, INF_COST)
+
+    @property
+    def parent(self) -> Optional["Node"]:
+        """Parent node for path reconstruction."""
+        index = self._arrays.parent_buffer[self._index]
+        if index >= 0:
+            return self._arrays.nodes[index]
+        if index == _FOREIGN_PARENT:
+            return self._foreign_parent
+        return None
+
+    @parent.setter
+    def parent(self, value: Optional["Node"]) -> None:
+        # Parents in the same arrays are stored by index; others by reference
+        if value is None:
+            index = -1
+        elif value._arrays is self._arrays:
+            index = value._index
+        else:
+            index = _FOREIGN_PARENT
+        self._foreign_parent = value if index == _FOREIGN_PARENT else None
+        self._arrays.parent_buffer[self._index] = index
 
     def __eq__(self, other: object) -> bool:
         """Check if two nodes are equal based on position."""
-        if not isinstance(other, Node):
+        if self is other:
+            return True
+        if type(other) is not Node:
             return NotImplemented
         return self.row == other.row and self.col == other.col
 
     def __hash__(self) -> int:
-        """Hash based on position."""
-        return hash((self.row, self.col))
-
-    def __lt__(self, other: "Node") -> bool:
-        """Compare nodes for priority queue ordering."""
-        if self.f_cost != other.f_cost:
-            return self.f_cost < other.f_cost
-        return self.cost < other.cost
+        """Hash based on position, computed once since nodes never move."""
+        return self._hash
 
     def __repr__(self) -> str:
         """String representation of the node."""
-        return f"Node({self.row}, {self.col}, state={self.state.value})"
+        return f"Node({self.row}, {self.col}, state={self.state.name.lower()})"
 
     def reset(self) -> None:
         """Reset node to initial state (except obstacle status)."""
-        if self.state != NodeState.OBSTACLE:
-            self.state = NodeState.UNVISITED
-        self.cost = float("inf")
+        if self.state != _OBSTACLE:
+            self.state = _UNVISITED
+        self.cost = INF_COST
         self.parent = None
-        self.g_cost = float("inf")
+        self.g_cost = INF_COST
         self.h_cost = 0.0
-        self.f_cost = float("inf")
+        self.f_cost = INF_COST
 
     def set_obstacle(self, is_obstacle: bool) -> None:
         """
@@ -91,11 +265,11 @@ class Node:
             is_obstacle: True to make this an obstacle, False to remove obstacle.
         """
         if is_obstacle:
-            self.state = NodeState.OBSTACLE
-            self.cost = float("inf")
-        elif self.state == NodeState.OBSTACLE:
-            self.state = NodeState.UNVISITED
-            self.cost = float("inf")
+            self.state = _OBSTACLE
+            self.cost = INF_COST
+        elif self.state == _OBSTACLE:
+            self.state = _UNVISITED
+            self.cost = INF_COST
 
     def is_traversable(self) -> bool:
         """
@@ -104,5 +278,131 @@ class Node:
         Returns:
             True if the node is not an obstacle.
         """
-        return self.state != NodeState.OBSTACLE
+        return self._arrays.state_buffer[self._index] != _OBSTACLE_CODE
+
+
+class _NodeCache(dict):
+    """
+    Node views of a GridArrays keyed by flat index, created on first access.
+
+    Looking up row * width + col returns the cell's Node, creating it the
+    first time and returning the same object afterwards. Views that exist
+    are plain dict entries, so lookups run at dict speed; cells that are
+    never looked at cost no memory.
+    """
+
+    __slots__ = ("_arrays",)
+
+    def __init__(self, arrays: GridArrays):
+        """
+        Create the cache for a set of grid arrays.
+
+        Args:
+            arrays: The arrays the nodes are views of.
+        """
+        super().__init__()
+        self._arrays = arrays
+
+    def __missing__(self, index: int) -> Node:
+        """Create the view of a cell that has not been accessed yet."""
+        arrays = self._arrays
+        if not 0 <= index < arrays.height * arrays.width:
+            raise IndexError("node index out of range")
+
+        row, col = divmod(index, arrays.width)
+        node = Node(row, col, arrays=arrays)
+        self[index] = node
+        return node
+
+
+class FlatNodes(Sequence):
+    """
+    Read-only sequence of a grid's nodes, indexed by row * width + col.
+
+    Behaves like a list of every Node in row-major order, but each Node
+    view is only created the first time it is accessed.
+    """
+
+    __slots__ = ("_arrays", "_nodes", "_size")
+
+    def __init__(self, arrays: GridArrays):
+        """
+        Create the sequence for a set of grid arrays.
+
+        Args:
+            arrays: The arrays the nodes are views of.
+        """
+        self._arrays = arrays
+        self._nodes = arrays.nodes
+        self._size = arrays.height * arrays.width
+
+    def __len__(self) -> int:
+        """Number of cells."""
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Node, List[Node]]:
+        """Get the Node at a flat index, or a list of Nodes for a slice."""
+        if isinstance(index, slice):
+            nodes = self._nodes
+            return [nodes[i] for i in range(*index.indices(self._size))]
+
+        index = index.__index__()
+        if index < 0:
+            index += self._size
+        return self._nodes[index]
+
+    def __iter__(self) -> Iterator[Node]:
+        """Iterate over the nodes in row-major order."""
+        nodes = self._nodes
+        return (nodes[index] for index in range(self._size))
+
+    def __contains__(self, value: object) -> bool:
+        """Check whether a node at the same position is in the grid."""
+        if type(value) is not Node:
+            return False
+        arrays = self._arrays
+        return 0 <= value.row < arrays.height and 0 <= value.col < arrays.width
+
+
+class NodeRows(Sequence):
+    """
+    The Node views of a grid as rows, indexed by [row][col].
+
+    Each row is a list of Nodes built from the grid's node views on first
+    access, so taking len() or a few rows does not create a view for every
+    cell.
+    """
+
+    __slots__ = ("_views", "_width", "_rows")
+
+    def __init__(self, views: Sequence, height: int, width: int):
+        """
+        Create the rows over a grid's node views.
+
+        Args:
+            views: The node views, indexed by row * width + col.
+            height: Number of rows.
+            width: Number of columns.
+        """
+        self._views = views
+        self._width = width
+        self._rows: List[Optional[List[Node]]] = [None] * height
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self._rows)
+
+    def __getitem__(
+        self, row: Union[int, slice]
+    ) -> Union[List[Node], List[List[Node]]]:
+        """Get the list of Nodes in a row, or a list of rows for a slice."""
+        if isinstance(row, slice):
+            return [self[index] for index in range(*row.indices(len(self)))]
 
+        nodes = self._rows[row]
+        if nodes is None:
+            row = row.__index__() % len(self._rows)
+            views, offset = self._views, row * self._width
+            nodes = [views[offset + col] for col in range(self._width)]
+            self._rows[row] = nodes
+        return nodes
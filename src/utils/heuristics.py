@@ -1,7 +1,10 @@
 """Heuristic functions for A* algorithm."""
 
+import math
 from typing import Callable
 
+import numpy as np
+
 from src.graph.node import Node
 
 
@@ -19,7 +22,7 @@ def manhattan_distance(node1: Node, node2: Node) -> float:
     Returns:
         Manhattan distance between the nodes.
     """
-    return abs(node1.row - node2.row) + abs(node1.col - node2.col)
+    return manhattan_distance_ij(node1.row, node1.col, node2.row, node2.col)
 
 
 def euclidean_distance(node1: Node, node2: Node) -> float:
@@ -36,9 +39,7 @@ def euclidean_distance(node1: Node, node2: Node) -> float:
     Returns:
         Euclidean distance between the nodes.
     """
-    dr = node1.row - node2.row
-    dc = node1.col - node2.col
-    return (dr * dr + dc * dc) ** 0.5
+    return euclidean_distance_ij(node1.row, node1.col, node2.row, node2.col)
 
 
 def chebyshev_distance(node1: Node, node2: Node) -> float:
@@ -56,7 +57,128 @@ def chebyshev_distance(node1: Node, node2: Node) -> float:
     Returns:
         Chebyshev distance between the nodes.
     """
-    return max(abs(node1.row - node2.row), abs(node1.col - node2.col))
+    return chebyshev_distance_ij(node1.row, node1.col, node2.row, node2.col)
+
+
+def manhattan_distance_ij(row1: int, col1: int, row2: int, col2: int) -> float:
+    """
+    Calculate Manhattan distance between two cells given by coordinates.
+
+    Takes plain integers, avoiding Node attribute lookups in hot loops.
+    The compiled search kernels use Numba-compiled copies of the *_ij
+    functions, so each formula is defined only here.
+
+    Args:
+        row1: Row of the first cell.
+        col1: Column of the first cell.
+        row2: Row of the second cell.
+        col2: Column of the second cell.
+
+    Returns:
+        Manhattan distance between the cells.
+    """
+    # Conditional negation avoids two calls to the abs() builtin
+    dr = row1 - row2
+    dc = col1 - col2
+    if dr < 0:
+        dr = -dr
+    if dc < 0:
+        dc = -dc
+    return dr + dc
+
+
+def euclidean_distance_ij(row1: int, col1: int, row2: int, col2: int) -> float:
+    """
+    Calculate Euclidean distance between two cells given by coordinates.
+
+    Args:
+        row1: Row of the first cell.
+        col1: Column of the first cell.
+        row2: Row of the second cell.
+        col2: Column of the second cell.
+
+    Returns:
+        Euclidean distance between the cells.
+    """
+    return math.hypot(row1 - row2, col1 - col2)
+
+
+def chebyshev_distance_ij(row1: int, col1: int, row2: int, col2: int) -> float:
+    """
+    Calculate Chebyshev distance between two cells given by coordinates.
+
+    Args:
+        row1: Row of the first cell.
+        col1: Column of the first cell.
+        row2: Row of the second cell.
+        col2: Column of the second cell.
+
+    Returns:
+        Chebyshev distance between the cells.
+    """
+    dr = row1 - row2
+    dc = col1 - col2
+    if dr < 0:
+        dr = -dr
+    if dc < 0:
+        dc = -dc
+    return dr if dr > dc else dc
+
+
+def manhattan_batch(
+    rows: np.ndarray, cols: np.ndarray, goal_row: int, goal_col: int
+) -> np.ndarray:
+    """
+    Calculate Manhattan distances from many cells to a goal at once.
+
+    Args:
+        rows: Row indices; broadcast against cols.
+        cols: Column indices.
+        goal_row: Row of the goal cell.
+        goal_col: Column of the goal cell.
+
+    Returns:
+        int32 array of Manhattan distances.
+    """
+    return (np.abs(rows - goal_row) + np.abs(cols - goal_col)).astype(np.int32)
+
+
+def euclidean_batch(
+    rows: np.ndarray, cols: np.ndarray, goal_row: int, goal_col: int
+) -> np.ndarray:
+    """
+    Calculate Euclidean distances from many cells to a goal at once.
+
+    Args:
+        rows: Row indices; broadcast against cols.
+        cols: Column indices.
+        goal_row: Row of the goal cell.
+        goal_col: Column of the goal cell.
+
+    Returns:
+        float64 array of Euclidean distances.
+    """
+    return np.hypot(rows - goal_row, cols - goal_col)
+
+
+def chebyshev_batch(
+    rows: np.ndarray, cols: np.ndarray, goal_row: int, goal_col: int
+) -> np.ndarray:
+    """
+    Calculate Chebyshev distances from many cells to a goal at once.
+
+    Args:
+        rows: Row indices; broadcast against cols.
+        cols: Column indices.
+        goal_row: Row of the goal cell.
+        goal_col: Column of the goal cell.
+
+    Returns:
+        int32 array of Chebyshev distances.
+    """
+    return np.maximum(np.abs(rows - goal_row), np.abs(cols - goal_col)).astype(
+        np.int32
+    )
 
 
 # Dictionary mapping heuristic names to functions
@@ -66,6 +188,22 @@ HEURISTICS: dict[str, Callable[[Node, Node], float]] = {
     "chebyshev": chebyshev_distance,
 }
 
+# Same heuristics taking (row1, col1, row2, col2) integers
+HEURISTICS_IJ: dict[str, Callable[[int, int, int, int], float]] = {
+    "manhattan": manhattan_distance_ij,
+    "euclidean": euclidean_distance_ij,
+    "chebyshev": chebyshev_distance_ij,
+}
+
+# Same heuristics evaluated over arrays of (row, col) indices
+HEURISTICS_BATCH: dict[
+    str, Callable[[np.ndarray, np.ndarray, int, int], np.ndarray]
+] = {
+    "manhattan": manhattan_batch,
+    "euclidean": euclidean_batch,
+    "chebyshev": chebyshev_batch,
+}
+
 
 def get_heuristic(name: str) -> Callable[[Node, Node], float]:
     """
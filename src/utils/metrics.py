@@ -1,11 +1,12 @@
 """Performance metrics and analysis utilities for pathfinding algorithms."""
 
 import time
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from src.algorithms.base import PathfindingAlgorithm
 from src.graph.grid import Grid
-from src.graph.node import NodeState
+
+if TYPE_CHECKING:
+    from src.algorithms.base import PathfindingAlgorithm
 
 
 class AlgorithmMetrics:
@@ -16,6 +17,18 @@ class AlgorithmMetrics:
     other relevant metrics for research and analysis purposes.
     """
 
+    __slots__ = (
+        "algorithm_name",
+        "execution_time",
+        "nodes_visited",
+        "nodes_explored",
+        "path_length",
+        "path_cost",
+        "path_found",
+        "memory_usage",
+        "additional_info",
+    )
+
     def __init__(self, algorithm_name: str):
         """
         Initialize metrics container.
@@ -63,7 +76,7 @@ class AlgorithmMetrics:
 
 
 def measure_algorithm(
-    algorithm: PathfindingAlgorithm, include_step_by_step: bool = False
+    algorithm: "PathfindingAlgorithm", include_step_by_step: bool = False
 ) -> AlgorithmMetrics:
     """
     Measure performance metrics for an algorithm execution.
@@ -74,18 +87,22 @@ def measure_algorithm(
 
     Returns:
         AlgorithmMetrics object containing all measured metrics.
+
+    Raises:
+        ValueError: If the algorithm's path moves between nodes that are not
+            traversable neighbors.
     """
     metrics = AlgorithmMetrics(algorithm.__class__.__name__)
 
-    # Reset algorithm state
+    # Reset algorithm state; this also resets its grid
     algorithm.reset()
-    algorithm.grid.reset()
 
     # Measure execution time
     start_time = time.perf_counter()
 
     if include_step_by_step:
         # Step-by-step execution for visualization
+        algorithm.initialize()
         while not algorithm.is_complete:
             algorithm.step()
     else:
@@ -103,22 +120,17 @@ def measure_algorithm(
 
     # Calculate path cost
     if algorithm.path:
-        metrics.path_cost = sum(
-            algorithm.grid.get_neighbors(algorithm.path[i])[0][1]
-            for i in range(len(algorithm.path) - 1)
-            if algorithm.grid.get_neighbors(algorithm.path[i])
-        )
-        # More accurate path cost calculation
-        total_cost = 0.0
-        for i in range(len(algorithm.path) - 1):
-            current = algorithm.path[i]
-            next_node = algorithm.path[i + 1]
-            neighbors = algorithm.grid.get_neighbors(current)
-            for neighbor, cost in neighbors:
-                if neighbor == next_node:
-                    total_cost += cost
-                    break
-        metrics.path_cost = total_cost
+        edge_cost = algorithm.grid.edge_cost
+        path_cost = 0.0
+        for current, next_node in zip(algorithm.path, algorithm.path[1:]):
+            cost = edge_cost(current, next_node)
+            if cost is None:
+                raise ValueError(
+                    f"Path steps between non-adjacent nodes {current} and "
+                    f"{next_node}"
+                )
+            path_cost += cost
+        metrics.path_cost = path_cost
 
     # Store additional algorithm-specific info
     for key, value in algo_metrics.items():
@@ -138,28 +150,11 @@ def clone_grid(grid: Grid) -> Grid:
     Returns:
         A new Grid instance with identical configuration.
     """
-    new_grid = Grid(
-        grid.width, grid.height, grid.allow_diagonal, grid.diagonal_cost
-    )
-
-    # Copy obstacles
-    for row in range(grid.height):
-        for col in range(grid.width):
-            node = grid.get_node(row, col)
-            if node and node.state == NodeState.OBSTACLE:
-                new_grid.add_obstacle(row, col)
-
-    # Copy start and end
-    if grid.start_node:
-        new_grid.set_start(grid.start_node.row, grid.start_node.col)
-    if grid.end_node:
-        new_grid.set_end(grid.end_node.row, grid.end_node.col)
-
-    return new_grid
+    return grid.clone()
 
 
 def compare_algorithms(
-    algorithms: List[PathfindingAlgorithm],
+    algorithms: List["PathfindingAlgorithm"],
     grid_sizes: List[tuple[int, int]] | None = None,
     obstacle_densities: List[float] | None = None,
 ) -> Dict[str, List[AlgorithmMetrics]]:
@@ -208,10 +203,14 @@ def compare_algorithms(
                 algo_class = algorithm.__class__
                 algo_name = algo_class.__name__
 
-                # Preserve AStar heuristic if present
+                # Preserve AStar heuristic and search mode if present
                 if algo_name == "AStar" and hasattr(algorithm, "heuristic_name"):
                     heuristic = algorithm.heuristic_name
-                    test_algorithm = algo_class(test_grid, heuristic=heuristic)
+                    test_algorithm = algo_class(
+                        test_grid,
+                        heuristic=heuristic,
+                        bidirectional=algorithm.bidirectional,
+                    )
                 else:
                     test_algorithm = algo_class(test_grid)
 
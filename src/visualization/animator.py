@@ -1,12 +1,17 @@
 """Animated step-by-step visualization of pathfinding algorithms."""
 
-import matplotlib.animation as animation
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING, Optional
+
 import numpy as np
 
-from src.algorithms.base import PathfindingAlgorithm
 from src.graph.grid import Grid
-from src.graph.node import NodeState
+from src.visualization.colors import STATE_COLOR_LUT, STATE_COLORS
+
+if TYPE_CHECKING:
+    import matplotlib.animation as animation
+    import matplotlib.pyplot as plt
+
+    from src.algorithms.base import PathfindingAlgorithm
 
 
 class Animator:
@@ -19,7 +24,7 @@ class Animator:
 
     def __init__(
         self,
-        algorithm: PathfindingAlgorithm,
+        algorithm: Optional["PathfindingAlgorithm"],
         grid: Grid,
         interval: int = 50,
         figsize: tuple[int, int] = (10, 10),
@@ -28,7 +33,8 @@ class Animator:
         Initialize the animator.
 
         Args:
-            algorithm: The pathfinding algorithm to visualize.
+            algorithm: The pathfinding algorithm to visualize. May be None if
+                      it is supplied later through set_algorithm().
             grid: The grid on which the algorithm operates.
             interval: Animation interval in milliseconds.
             figsize: Figure size (width, height) in inches.
@@ -41,35 +47,79 @@ class Animator:
         self.fig: plt.Figure | None = None
         self.ax: plt.Axes | None = None
         self.im: plt.AxesImage | None = None
+        self.image: np.ndarray | None = None  # Buffer shown by self.im
+        self.shown_states: np.ndarray | None = None  # States drawn in self.image
+        self._changed: np.ndarray | None = None  # Scratch mask for _update_frame
+        self.colorbar: plt.Colorbar | None = None
         self.animation: animation.FuncAnimation | None = None
 
-        # Color mapping for node states
-        self.colors = {
-            NodeState.UNVISITED: 1.0,  # White
-            NodeState.VISITED: 0.6,  # Blue
-            NodeState.FRONTIER: 0.8,  # Yellow
-            NodeState.PATH: 0.2,  # Green
-            NodeState.OBSTACLE: 0.0,  # Black
-            NodeState.START: 0.4,  # Cyan
-            NodeState.END: 0.3,  # Magenta
-        }
-
-    def _create_grid_image(self) -> np.ndarray:
+        # Color mapping for node states, shared by all visualizers
+        self.colors = STATE_COLORS
+        self.colors_lut = STATE_COLOR_LUT
+
+    def set_algorithm(self, algorithm: "PathfindingAlgorithm") -> None:
         """
-        Create a 2D array representation of the grid for visualization.
+        Switch to another algorithm, keeping the existing figure and axes.
 
-        Returns:
-            2D numpy array with values corresponding to node states.
+        Args:
+            algorithm: The pathfinding algorithm to visualize next.
         """
-        image = np.zeros((self.grid.height, self.grid.width))
+        if self.animation:
+            self.animation.event_source.stop()
+            self.animation = None
+        self.algorithm = algorithm
 
-        for row in range(self.grid.height):
-            for col in range(self.grid.width):
-                node = self.grid.get_node(row, col)
-                if node:
-                    image[row, col] = self.colors.get(node.state, 1.0)
+    def _prepare_axes(self, title: str, animated: bool = False) -> None:
+        """
+        Draw the current grid on the figure, creating it only when needed.
+
+        The figure, axes and colorbar are reused across runs as long as the
+        figure window is still open; otherwise a new figure is created.
 
-        return image
+        Args:
+            title: Title for the axes.
+            animated: Whether the image will be redrawn by blitting.
+        """
+        import matplotlib.pyplot as plt
+
+        if self.fig is None or not plt.fignum_exists(self.fig.number):
+            self.fig, self.ax = plt.subplots(figsize=self.figsize)
+            self.colorbar = None
+        else:
+            self.ax.cla()
+
+        self.ax.set_title(title, fontsize=14, fontweight="bold")
+        self.ax.set_xlabel("Column")
+        self.ax.set_ylabel("Row")
+
+        # Reuse the buffers of an earlier run on a grid of the same shape
+        states = self.grid.state_array
+        if self.image is None or self.image.shape != states.shape:
+            self.image = np.empty(states.shape, dtype=self.colors_lut.dtype)
+            self.shown_states = np.empty_like(states)
+            self._changed = np.empty(states.shape, dtype=bool)
+        np.take(self.colors_lut, states, out=self.image)
+        np.copyto(self.shown_states, states)
+        self.im = self.ax.imshow(
+            self.image,
+            animated=animated,
+            cmap="viridis",
+            vmin=0.0,
+            vmax=1.0,
+            interpolation="nearest",
+            aspect="equal",
+        )
+
+        # Add colorbar with labels
+        if self.colorbar is None:
+            self.colorbar = self.fig.colorbar(
+                self.im, ax=self.ax, ticks=[0, 0.2, 0.3, 0.4, 0.6, 0.8, 1.0]
+            )
+            self.colorbar.set_ticklabels(
+                ["Obstacle", "Path", "End", "Start", "Visited", "Frontier", "Unvisited"]
+            )
+        else:
+            self.colorbar.update_normal(self.im)
 
     def _update_frame(self, frame: int) -> list:
         """
@@ -87,9 +137,16 @@ class Animator:
             # Stop animation when algorithm is complete
             self.animation.event_source.stop()
 
-        # Update the image
+        # Recolor only the cells whose state changed since the last frame
         if self.im:
-            self.im.set_array(self._create_grid_image())
+            states = self.grid.state_array
+            np.not_equal(states, self.shown_states, out=self._changed)
+            changed = np.flatnonzero(self._changed)
+            if changed.size > 0:
+                codes = states.ravel()[changed]
+                self.image.ravel()[changed] = self.colors_lut[codes]
+                self.shown_states.ravel()[changed] = codes
+                self.im.set_data(self.image)
 
         return [self.im] if self.im else []
 
@@ -99,7 +156,16 @@ class Animator:
 
         Args:
             save_path: Optional path to save the animation as a GIF or video.
+
+        Raises:
+            ValueError: If no algorithm has been set.
         """
+        if self.algorithm is None:
+            raise ValueError("No algorithm set; call set_algorithm() first")
+
+        import matplotlib.animation as animation
+        import matplotlib.pyplot as plt
+
         # Reset algorithm
         self.algorithm.reset()
         self.grid.reset()
@@ -107,31 +173,9 @@ class Animator:
         # Initialize algorithm (sets up start node in priority queue, etc.)
         self.algorithm.initialize()
 
-        # Create figure and axes
-        self.fig, self.ax = plt.subplots(figsize=self.figsize)
-        self.ax.set_title(
+        self._prepare_axes(
             f"{self.algorithm.__class__.__name__} Algorithm Visualization",
-            fontsize=14,
-            fontweight="bold",
-        )
-        self.ax.set_xlabel("Column")
-        self.ax.set_ylabel("Row")
-
-        # Create initial image
-        initial_image = self._create_grid_image()
-        self.im = self.ax.imshow(
-            initial_image,
-            cmap="viridis",
-            vmin=0.0,
-            vmax=1.0,
-            interpolation="nearest",
-            aspect="equal",
-        )
-
-        # Add colorbar with labels
-        cbar = self.fig.colorbar(self.im, ax=self.ax, ticks=[0, 0.2, 0.3, 0.4, 0.6, 0.8, 1.0])
-        cbar.set_ticklabels(
-            ["Obstacle", "Path", "End", "Start", "Visited", "Frontier", "Unvisited"]
+            animated=True,
         )
 
         # Create animation
@@ -157,36 +201,23 @@ class Animator:
     def show_final(self) -> None:
         """
         Show the final state of the algorithm without animation.
+
+        An algorithm that has already run to completion, for example through
+        measure_algorithm(), is shown as is instead of being run again.
+
+        Raises:
+            ValueError: If no algorithm has been set.
         """
-        # Run algorithm to completion
-        self.algorithm.find_path()
-
-        # Create figure
-        self.fig, self.ax = plt.subplots(figsize=self.figsize)
-        self.ax.set_title(
-            f"{self.algorithm.__class__.__name__} - Final Result",
-            fontsize=14,
-            fontweight="bold",
-        )
-        self.ax.set_xlabel("Column")
-        self.ax.set_ylabel("Row")
+        if self.algorithm is None:
+            raise ValueError("No algorithm set; call set_algorithm() first")
 
-        # Create image
-        final_image = self._create_grid_image()
-        self.im = self.ax.imshow(
-            final_image,
-            cmap="viridis",
-            vmin=0.0,
-            vmax=1.0,
-            interpolation="nearest",
-            aspect="equal",
-        )
+        import matplotlib.pyplot as plt
 
-        # Add colorbar
-        cbar = self.fig.colorbar(self.im, ax=self.ax, ticks=[0, 0.2, 0.3, 0.4, 0.6, 0.8, 1.0])
-        cbar.set_ticklabels(
-            ["Obstacle", "Path", "End", "Start", "Visited", "Frontier", "Unvisited"]
-        )
+        # Run algorithm to completion unless that already happened
+        if not self.algorithm.is_complete:
+            self.algorithm.find_path()
+
+        self._prepare_axes(f"{self.algorithm.__class__.__name__} - Final Result")
 
         # Add metrics text
         metrics = self.algorithm.get_metrics()
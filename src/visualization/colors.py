@@ -0,0 +1,44 @@
+"""Color mapping of node states shared by the visualizers."""
+
+from functools import lru_cache
+
+import numpy as np
+
+from src.graph.node import NodeState
+
+# Colormap value of each node state, rendered with viridis over [0, 1]
+STATE_COLORS: dict[NodeState, float] = {
+    NodeState.UNVISITED: 1.0,  # White
+    NodeState.VISITED: 0.6,  # Blue
+    NodeState.FRONTIER: 0.8,  # Yellow
+    NodeState.PATH: 0.2,  # Green
+    NodeState.OBSTACLE: 0.0,  # Black
+    NodeState.START: 0.4,  # Cyan
+    NodeState.END: 0.3,  # Magenta
+}
+
+# Color value per NodeState code, for rendering Grid.state_array
+STATE_COLOR_LUT = np.array(
+    [STATE_COLORS[state] for state in NodeState], dtype=np.float32
+)
+STATE_COLOR_LUT.flags.writeable = False
+
+
+@lru_cache(maxsize=None)
+def state_rgba_lut(cmap: str = "viridis") -> np.ndarray:
+    """
+    Get the uint8 RGBA color of each NodeState code under a colormap.
+
+    The result is computed once per colormap and shared; it is read-only.
+
+    Args:
+        cmap: Name of a registered matplotlib colormap.
+
+    Returns:
+        (len(NodeState), 4) uint8 array indexed by state code.
+    """
+    import matplotlib
+
+    lut = matplotlib.colormaps[cmap](STATE_COLOR_LUT, bytes=True)
+    lut.flags.writeable = False
+    return lut
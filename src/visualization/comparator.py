@@ -1,11 +1,56 @@
 """Side-by-side comparison of multiple pathfinding algorithms."""
 
-import matplotlib.pyplot as plt
+import multiprocessing
+import time
+from typing import TYPE_CHECKING, Any, List, Optional
+
 import numpy as np
 
-from src.algorithms.base import PathfindingAlgorithm
 from src.graph.grid import Grid
-from src.graph.node import NodeState
+from src.graph.node import STATE_CODES, NodeState
+from src.visualization.colors import STATE_COLOR_LUT, STATE_COLORS, state_rgba_lut
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+    from src.algorithms.base import PathfindingAlgorithm
+
+# Longest time spent stepping between two display refreshes, in seconds
+_FRAME_BUDGET = 0.016
+
+
+def _run_detached(payload: tuple) -> tuple[List[int], Optional[List[int]], bytes]:
+    """
+    Run one algorithm on a grid rebuilt from a picklable description.
+
+    Used as the worker function of the process pool in compare_final().
+
+    Args:
+        payload: Tuple (grid_config, obstacles, start, end, algorithm_class,
+                 kwargs) as built by Comparator._detached_payload().
+
+    Returns:
+        Tuple (visited, path, states) with the flat indices of visited
+        cells in expansion order, the flat indices along the path (or None),
+        and the grid's final state codes.
+    """
+    grid_config, obstacles, start, end, algorithm_class, kwargs = payload
+    grid = Grid(*grid_config)
+    grid.arrays.state.ravel()[obstacles] = NodeState.OBSTACLE
+    if start is not None:
+        grid.set_start(*start)
+    if end is not None:
+        grid.set_end(*end)
+
+    algorithm = algorithm_class(grid, **kwargs)
+    path = algorithm.find_path()
+
+    width = grid.width
+    visited = [node.row * width + node.col for node in algorithm.visited_nodes]
+    path_indices = None
+    if path is not None:
+        path_indices = [node.row * width + node.col for node in path]
+    return visited, path_indices, grid.state_array.tobytes()
 
 
 class Comparator:
@@ -19,7 +64,7 @@ class Comparator:
     def __init__(
         self,
         grid: Grid,
-        algorithms: list[PathfindingAlgorithm],
+        algorithms: list["PathfindingAlgorithm"],
         figsize: tuple[int, int] = (16, 8),
     ):
         """
@@ -35,21 +80,7 @@ class Comparator:
         self.figsize = figsize
 
         # Create separate grids for each algorithm
-        self.grids: list[Grid] = []
-        for _ in algorithms:
-            new_grid = Grid(grid.width, grid.height, grid.allow_diagonal, grid.diagonal_cost)
-            # Copy obstacles
-            for row in range(grid.height):
-                for col in range(grid.width):
-                    node = grid.get_node(row, col)
-                    if node and node.state == NodeState.OBSTACLE:
-                        new_grid.add_obstacle(row, col)
-            # Copy start and end
-            if grid.start_node:
-                new_grid.set_start(grid.start_node.row, grid.start_node.col)
-            if grid.end_node:
-                new_grid.set_end(grid.end_node.row, grid.end_node.col)
-            self.grids.append(new_grid)
+        self.grids: list[Grid] = [grid.clone() for _ in algorithms]
 
         # Update algorithms to use their respective grids
         for i, algo in enumerate(self.algorithms):
@@ -58,49 +89,101 @@ class Comparator:
         self.fig: plt.Figure | None = None
         self.axes: list[plt.Axes] = []
         self.images: list[plt.AxesImage] = []
-
-        # Color mapping
-        self.colors = {
-            NodeState.UNVISITED: 1.0,
-            NodeState.VISITED: 0.6,
-            NodeState.FRONTIER: 0.8,
-            NodeState.PATH: 0.2,
-            NodeState.OBSTACLE: 0.0,
-            NodeState.START: 0.4,
-            NodeState.END: 0.3,
-        }
+        # Per-axes backgrounds for blitting in compare_step_by_step()
+        self._backgrounds: list[Any] = []
+        # Displayed image, the state codes it shows, and a scratch mask for
+        # _update_all_displays(), per grid; allocated once and reused
+        shape = (grid.height, grid.width)
+        self._image_buffers = [np.empty(shape, dtype=np.float32) for _ in algorithms]
+        self._shown_states = [np.empty(shape, dtype=np.uint8) for _ in algorithms]
+        self._changed = [np.empty(shape, dtype=bool) for _ in algorithms]
+
+        # Color mapping, shared by all visualizers
+        self.colors = STATE_COLORS
+        self.colors_lut = STATE_COLOR_LUT
 
     def _create_grid_image(self, grid: Grid) -> np.ndarray:
         """Create a 2D array representation of a grid."""
-        image = np.zeros((grid.height, grid.width))
+        return self.colors_lut[grid.state_array]
 
-        for row in range(grid.height):
-            for col in range(grid.width):
-                node = grid.get_node(row, col)
-                if node:
-                    image[row, col] = self.colors.get(node.state, 1.0)
+    def _create_grid_rgba(self, grid: Grid) -> np.ndarray:
+        """
+        Create a (height, width, 4) uint8 RGBA image of a grid.
 
-        return image
+        Colors match the viridis rendering of _create_grid_image(), but come
+        from a precomputed per-state RGBA table, so matplotlib has no
+        normalization or colormapping to do.
+        """
+        return state_rgba_lut("viridis")[grid.state_array]
 
-    def _update_all_displays(self) -> None:
-        """Update all algorithm visualizations."""
-        for i, (grid, im) in enumerate(zip(self.grids, self.images)):
-            im.set_array(self._create_grid_image(grid))
+    def _capture_backgrounds(self, event: Any = None) -> None:
+        """
+        Store the static part of every axes and redraw the grid images.
 
-        self.fig.canvas.draw_idle()
+        Connected to the canvas' draw_event, so the backgrounds are captured
+        again after every full redraw (e.g. when the window is resized).
 
-    def compare_step_by_step(self, interval: int = 50) -> None:
+        Args:
+            event: The draw event, unused.
+        """
+        canvas = self.fig.canvas
+        self._backgrounds = [canvas.copy_from_bbox(ax.bbox) for ax in self.axes]
+        for ax, im in zip(self.axes, self.images):
+            ax.draw_artist(im)
+
+    def _update_all_displays(self) -> None:
+        """Update all algorithm visualizations."""
+        # Recolor only the cells whose state changed since the last update
+        updated = []
+        for i, grid in enumerate(self.grids):
+            states = grid.state_array
+            shown = self._shown_states[i]
+            changed = np.flatnonzero(np.not_equal(states, shown, out=self._changed[i]))
+            if changed.size == 0:
+                continue
+            codes = states.ravel()[changed]
+            self._image_buffers[i].ravel()[changed] = self.colors_lut[codes]
+            shown.ravel()[changed] = codes
+            self.images[i].set_data(self._image_buffers[i])
+            updated.append(i)
+
+        if not updated:
+            return
+        if not self._backgrounds:
+            self.fig.canvas.draw_idle()
+            return
+
+        # Blit only the changed grid images over the stored backgrounds
+        # instead of redrawing titles, ticks and the colorbar every step
+        canvas = self.fig.canvas
+        for i in updated:
+            ax = self.axes[i]
+            canvas.restore_region(self._backgrounds[i])
+            ax.draw_artist(self.images[i])
+            canvas.blit(ax.bbox)
+
+    def compare_step_by_step(
+        self, interval: int = 50, steps_per_frame: Optional[int] = None
+    ) -> None:
         """
         Compare algorithms step-by-step with synchronized visualization.
 
         Args:
-            interval: Delay between steps in milliseconds.
+            interval: Delay between display refreshes in milliseconds.
+            steps_per_frame: Maximum number of steps each algorithm takes
+                            between two refreshes. Defaults to one step per
+                            1000 grid cells. A batch also ends once stepping
+                            has taken longer than a frame (about 16ms).
         """
-        # Reset all algorithms
+        import matplotlib.pyplot as plt
+
+        if steps_per_frame is None:
+            grid = self.original_grid
+            steps_per_frame = max(1, grid.width * grid.height // 1000)
+
+        # Reset all algorithms, and with them their grids
         for algo in self.algorithms:
             algo.reset()
-        for grid in self.grids:
-            grid.reset()
         
         # Initialize all algorithms (sets up start node in priority queue, etc.)
         for algo in self.algorithms:
@@ -114,11 +197,16 @@ class Comparator:
             self.axes = [self.axes]
 
         self.images = []
+        # Animated artists are left out of regular draws, so only mark the
+        # images animated when they will be blitted
+        blit = self.fig.canvas.supports_blit
 
         # Initialize each subplot
         for i, (algo, ax) in enumerate(zip(self.algorithms, self.axes)):
             grid = self.grids[i]
-            initial_image = self._create_grid_image(grid)
+            initial_image = self._image_buffers[i]
+            np.take(self.colors_lut, grid.state_array, out=initial_image)
+            np.copyto(self._shown_states[i], grid.state_array)
 
             im = ax.imshow(
                 initial_image,
@@ -127,6 +215,7 @@ class Comparator:
                 vmax=1.0,
                 interpolation="nearest",
                 aspect="equal",
+                animated=blit,
             )
             self.images.append(im)
 
@@ -145,24 +234,47 @@ class Comparator:
             ["Obstacle", "Path", "End", "Start", "Visited", "Frontier", "Unvisited"]
         )
 
-        # Main comparison loop
-        all_complete = False
+        # Draw the static figure once and blit the images from then on
+        self._backgrounds = []
+        draw_cid = None
+        plt.show(block=False)
+        if blit:
+            draw_cid = self.fig.canvas.mpl_connect(
+                "draw_event", self._capture_backgrounds
+            )
+            self.fig.canvas.draw()
+
+        # Main comparison loop, over the algorithms that are still running
+        active = [algo for algo in self.algorithms if not algo.is_complete]
         step_count = 0
         max_steps = self.original_grid.width * self.original_grid.height * 2
 
-        while not all_complete and step_count < max_steps:
-            all_complete = True
-
-            # Step each algorithm
-            for algo in self.algorithms:
-                if not algo.is_complete:
-                    algo.step()
-                    all_complete = False
-
-            # Update displays
+        while active and step_count < max_steps:
+            # Step each algorithm a batch of times per display refresh
+            deadline = time.perf_counter() + _FRAME_BUDGET
+            for _ in range(steps_per_frame):
+                # step() returns False once the algorithm is complete
+                finished = False
+                for algo in active:
+                    if not algo.step():
+                        finished = True
+                step_count += 1
+                if finished:
+                    active = [algo for algo in active if not algo.is_complete]
+                if not active or time.perf_counter() > deadline:
+                    break
+
+            # Update displays, then let the GUI process events; unlike
+            # plt.pause() this does not redraw the whole figure when stale
             self._update_all_displays()
-            plt.pause(interval / 1000.0)
-            step_count += 1
+            self.fig.canvas.start_event_loop(interval / 1000.0)
+
+        # Back to regular drawing for the final figure
+        if draw_cid is not None:
+            self.fig.canvas.mpl_disconnect(draw_cid)
+        self._backgrounds = []
+        for im in self.images:
+            im.set_animated(False)
 
         # Show final metrics
         for i, (algo, ax) in enumerate(zip(self.algorithms, self.axes)):
@@ -186,11 +298,112 @@ class Comparator:
         plt.tight_layout()
         plt.show()
 
-    def compare_final(self) -> None:
-        """Compare algorithms by showing only their final results."""
+    def _detached_payload(
+        self, algo: "PathfindingAlgorithm", grid: Grid
+    ) -> Optional[tuple]:
+        """
+        Describe an algorithm run so it can be repeated in another process.
+
+        Args:
+            algo: The algorithm to describe.
+            grid: The grid the algorithm runs on.
+
+        Returns:
+            Payload for _run_detached(), or None if the algorithm cannot be
+            rebuilt from picklable arguments (e.g. a custom heuristic).
+        """
+        kwargs: dict[str, Any] = {}
+        if hasattr(algo, "heuristic_name"):
+            if algo.heuristic_name == "custom":
+                return None
+            kwargs["heuristic"] = algo.heuristic_name
+            kwargs["bidirectional"] = algo.bidirectional
+
+        start = (grid.start_node.row, grid.start_node.col) if grid.start_node else None
+        end = (grid.end_node.row, grid.end_node.col) if grid.end_node else None
+        obstacles = np.flatnonzero(
+            grid.state_array.ravel() == STATE_CODES[NodeState.OBSTACLE]
+        ).tolist()
+        grid_config = (grid.width, grid.height, grid.allow_diagonal, grid.diagonal_cost)
+        return grid_config, obstacles, start, end, type(algo), kwargs
+
+    def _apply_detached_result(
+        self,
+        algo: "PathfindingAlgorithm",
+        grid: Grid,
+        result: tuple[List[int], Optional[List[int]], bytes],
+    ) -> None:
+        """
+        Copy the outcome of a run in another process onto an algorithm and grid.
+
+        Args:
+            algo: The algorithm that was run remotely.
+            grid: The local grid of that algorithm.
+            result: Return value of _run_detached().
+        """
+        visited, path, states = result
+        algo.reset()
+
+        flat_nodes = grid.flat_nodes
+        grid.arrays.state.ravel()[:] = np.frombuffer(states, dtype=np.uint8)
+
+        algo.visited_nodes.extend(flat_nodes[index] for index in visited)
+        if path is not None:
+            algo.path = [flat_nodes[index] for index in path]
+            for previous, node in zip(algo.path, algo.path[1:]):
+                node.parent = previous
+            algo.is_path_found = True
+        algo.is_complete = True
+
+    def _run_all(self, parallel: bool) -> None:
+        """
+        Run every algorithm to completion.
+
+        Args:
+            parallel: If True, run the algorithms in a process pool. Runs
+                     that cannot be sent to another process stay local.
+        """
+        payloads = [
+            self._detached_payload(algo, grid) if parallel else None
+            for algo, grid in zip(self.algorithms, self.grids)
+        ]
+        detached = [i for i, payload in enumerate(payloads) if payload is not None]
+
+        if len(detached) < 2:
+            detached = []
+
+        local = [i for i in range(len(self.algorithms)) if i not in detached]
+        if not detached:
+            for i in local:
+                self.algorithms[i].find_path()
+            return
+
+        with multiprocessing.Pool(len(detached)) as pool:
+            pending = pool.map_async(_run_detached, [payloads[i] for i in detached])
+            # Run what has to stay local while the pool works
+            for i in local:
+                self.algorithms[i].find_path()
+            results = pending.get()
+
+        for i, result in zip(detached, results):
+            self._apply_detached_result(self.algorithms[i], self.grids[i], result)
+
+    def compare_final(self, parallel: bool = False, fast_render: bool = False) -> None:
+        """
+        Compare algorithms by showing only their final results.
+
+        Args:
+            parallel: If True, run the algorithms in separate processes.
+                     Worth it for large grids; for small ones the cost of
+                     starting the processes outweighs the search itself.
+            fast_render: If True, show each grid as a precomputed RGBA
+                        image without ticks, axis labels or colorbar, which
+                        draws much faster on large grids.
+        """
+        import matplotlib.pyplot as plt
+
         # Run all algorithms to completion
-        for algo in self.algorithms:
-            algo.find_path()
+        self._run_all(parallel)
 
         # Create figure with subplots
         num_algorithms = len(self.algorithms)
@@ -204,24 +417,28 @@ class Comparator:
         # Display each algorithm's result
         for i, (algo, ax) in enumerate(zip(self.algorithms, self.axes)):
             grid = self.grids[i]
-            final_image = self._create_grid_image(grid)
-
-            im = ax.imshow(
-                final_image,
-                cmap="viridis",
-                vmin=0.0,
-                vmax=1.0,
-                interpolation="nearest",
-                aspect="equal",
-            )
+            if fast_render:
+                im = ax.imshow(
+                    self._create_grid_rgba(grid), interpolation="none", aspect="equal"
+                )
+                ax.set_axis_off()
+            else:
+                im = ax.imshow(
+                    self._create_grid_image(grid),
+                    cmap="viridis",
+                    vmin=0.0,
+                    vmax=1.0,
+                    interpolation="nearest",
+                    aspect="equal",
+                )
+                ax.set_xlabel("Column")
+                ax.set_ylabel("Row")
             self.images.append(im)
 
             algo_name = algo.__class__.__name__
             if hasattr(algo, "heuristic_name"):
                 algo_name += f" ({algo.heuristic_name})"
             ax.set_title(algo_name, fontsize=12, fontweight="bold")
-            ax.set_xlabel("Column")
-            ax.set_ylabel("Row")
 
             # Add metrics
             metrics = algo.get_metrics()
@@ -241,12 +458,13 @@ class Comparator:
             )
 
         # Add shared colorbar
-        cbar = self.fig.colorbar(
-            self.images[0], ax=self.axes, ticks=[0, 0.2, 0.3, 0.4, 0.6, 0.8, 1.0]
-        )
-        cbar.set_ticklabels(
-            ["Obstacle", "Path", "End", "Start", "Visited", "Frontier", "Unvisited"]
-        )
+        if not fast_render:
+            cbar = self.fig.colorbar(
+                self.images[0], ax=self.axes, ticks=[0, 0.2, 0.3, 0.4, 0.6, 0.8, 1.0]
+            )
+            cbar.set_ticklabels(
+                ["Obstacle", "Path", "End", "Start", "Visited", "Frontier", "Unvisited"]
+            )
 
         plt.suptitle("Algorithm Comparison - Final Results", fontsize=14, fontweight="bold")
         plt.tight_layout()
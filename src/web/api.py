@@ -1,13 +1,253 @@
 """Flask API server for algorithm visualization."""
 
+import hashlib
+import json
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from flask import Flask, jsonify, request, send_from_directory
+import numpy as np
 
-from src.algorithms import AStar, Dijkstra
+from flask import (
+    Flask,
+    Response,
+    jsonify,
+    request,
+    send_from_directory,
+    stream_with_context,
+)
+
+from src.algorithms import AStar, Dijkstra, PathfindingAlgorithm
 from src.graph import Grid
-from src.web.data_generator import generate_comparison_data
+from src.web.data_generator import (
+    generate_comparison_data,
+    stream_comparison_data,
+    warm_up,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# Predefined grid configurations served by /api/presets
+PRESETS: Dict[str, Dict[str, Any]] = {
+    "simple": {
+        "width": 30,
+        "height": 30,
+        "obstacles": [],
+        "start": [0, 0],
+        "end": [29, 29],
+        "allow_diagonal": False,
+    },
+    "maze": {
+        "width": 40,
+        "height": 40,
+        "obstacles": [
+            # Create a simple maze pattern
+            *[[10, i] for i in range(5, 35)],
+            *[[20, i] for i in range(5, 35)],
+            *[[i, 15] for i in range(5, 15)],
+            *[[i, 25] for i in range(15, 25)],
+        ],
+        "start": [0, 0],
+        "end": [39, 39],
+        "allow_diagonal": False,
+    },
+    "random": {
+        "width": 40,
+        "height": 40,
+        "obstacles": "random",  # Special marker for random generation
+        "start": [0, 0],
+        "end": [39, 39],
+        "allow_diagonal": False,
+        "density": 0.25,
+    },
+    "open_field": {
+        "width": 50,
+        "height": 50,
+        "obstacles": [],
+        "start": [5, 5],
+        "end": [45, 45],
+        "allow_diagonal": True,
+    },
+}
+
+# The presets never change, so their JSON and ETag are built once
+_PRESETS_JSON = json.dumps(PRESETS)
+_PRESETS_ETAG = hashlib.md5(_PRESETS_JSON.encode()).hexdigest()
+
+
+def _json_response(data: Any) -> Response:
+    """
+    Serialize data to a JSON response.
+
+    Uses orjson when it is installed, which is several times faster than
+    the standard library on the large comparison payloads (NumPy arrays are
+    serialized directly), and falls back to flask.jsonify otherwise.
+
+    Args:
+        data: JSON-serializable data.
+
+    Returns:
+        application/json response.
+    """
+    if orjson is None:
+        return jsonify(data)
+    return Response(
+        orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY),
+        mimetype="application/json",
+    )
+
+
+@dataclass
+class CompareRequest:
+    """
+    Validated body of a comparison request.
+
+    Attributes:
+        width: Grid width.
+        height: Grid height.
+        obstacles: (N, 2) integer array of obstacle (row, col) positions.
+        start: (row, col) start position, or None to leave it unset.
+        end: (row, col) end position, or None to leave it unset.
+        allow_diagonal: Whether to allow diagonal movement.
+        diagonal_cost: Cost of a diagonal move.
+        density: Random obstacle density, used instead of obstacles if set.
+        algorithms: Names of the algorithms to compare.
+    """
+
+    width: int = 40
+    height: int = 40
+    obstacles: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 2), dtype=np.intp)
+    )
+    start: Optional[Tuple[int, int]] = (0, 0)
+    end: Optional[Tuple[int, int]] = None
+    allow_diagonal: bool = False
+    diagonal_cost: float = 1.414
+    density: Optional[float] = None
+    algorithms: List[str] = field(default_factory=lambda: ["Dijkstra", "AStar"])
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CompareRequest":
+        """
+        Validate a request body once and convert it to typed fields.
+
+        Missing fields take the defaults above; the end defaults to the
+        bottom-right cell. Start and end positions that are not pairs are
+        left unset, and obstacles that are not pairs are dropped, as is a
+        non-list obstacles value (e.g. the "random" preset marker).
+
+        Args:
+            data: Request body, see the /api/compare route.
+
+        Returns:
+            The validated request.
+
+        Raises:
+            ValueError: If a field has the wrong type.
+        """
+        try:
+            width = int(data.get("width", 40))
+            height = int(data.get("height", 40))
+            density = data.get("density")
+            names = data.get("algorithms", ["Dijkstra", "AStar"])
+            # bool() would read the strings "false" and "0" as True
+            allow_diagonal = data.get("allow_diagonal", False)
+            if not isinstance(allow_diagonal, bool):
+                raise TypeError(
+                    f"allow_diagonal must be a boolean, got {allow_diagonal!r}"
+                )
+            return cls(
+                width=width,
+                height=height,
+                obstacles=cls._parse_obstacles(data.get("obstacles", [])),
+                start=cls._parse_position(data.get("start", [0, 0])),
+                end=cls._parse_position(data.get("end", [height - 1, width - 1])),
+                allow_diagonal=allow_diagonal,
+                diagonal_cost=float(data.get("diagonal_cost", 1.414)),
+                density=None if density is None else float(density),
+                algorithms=[str(name) for name in names],
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid request: {e}") from e
+
+    @staticmethod
+    def _parse_position(value: Any) -> Optional[Tuple[int, int]]:
+        """Convert a [row, col] pair, or return None for anything else."""
+        if not isinstance(value, (list, tuple)) or len(value) != 2:
+            return None
+        return int(value[0]), int(value[1])
+
+    @staticmethod
+    def _parse_obstacles(value: Any) -> np.ndarray:
+        """Convert a list of [row, col] pairs to an (N, 2) array."""
+        if not isinstance(value, list):
+            value = []
+        try:
+            # A well-formed list converts in one call
+            coords = np.asarray(value, dtype=np.intp)
+        except (TypeError, ValueError):
+            coords = None
+        if coords is None or coords.ndim != 2 or coords.shape[1] != 2:
+            # Drop the entries that are not pairs
+            coords = np.asarray(
+                [obstacle for obstacle in value if len(obstacle) == 2], dtype=np.intp
+            )
+        return coords.reshape(-1, 2)
+
+
+def _build_comparison(
+    params: CompareRequest,
+) -> Tuple[Grid, List[PathfindingAlgorithm]]:
+    """
+    Build the grid and algorithms described by a comparison request.
+
+    Args:
+        params: The validated request.
+
+    Returns:
+        Tuple (grid, algorithms).
+
+    Raises:
+        ValueError: If the grid or an algorithm name is invalid.
+    """
+    grid = Grid(
+        params.width, params.height, params.allow_diagonal, params.diagonal_cost
+    )
+
+    # Set start and end first (before obstacles)
+    if params.start is not None:
+        grid.set_start(*params.start)
+    if params.end is not None:
+        grid.set_end(*params.end)
+
+    if params.density is not None:
+        # Generate random obstacles if density is provided
+        grid.add_obstacles_random(density=params.density)
+    else:
+        grid.add_obstacles(params.obstacles)
+
+    # Create algorithms
+    algorithms: List[PathfindingAlgorithm] = []
+
+    for algo_name in params.algorithms:
+        if algo_name == "Dijkstra":
+            algorithms.append(Dijkstra(grid))
+        elif algo_name.startswith("AStar"):
+            # Parse heuristic if provided (e.g., "AStar:manhattan")
+            parts = algo_name.split(":")
+            heuristic = parts[1] if len(parts) > 1 else "manhattan"
+            algorithms.append(AStar(grid, heuristic=heuristic))
+        else:
+            raise ValueError(f"Unknown algorithm: {algo_name}")
+
+    if not algorithms:
+        raise ValueError("No valid algorithms specified")
+
+    return grid, algorithms
 
 
 def create_app() -> Flask:
@@ -19,6 +259,9 @@ def create_app() -> Flask:
     """
     app = Flask(__name__, static_folder=None)
 
+    # Compile the kernels now rather than during the first request
+    warm_up()
+
     # Get paths
     project_root = Path(__file__).parent.parent.parent
     web_dir = project_root / "web"
@@ -55,67 +298,54 @@ def create_app() -> Flask:
             if not data:
                 return jsonify({"error": "No JSON data provided"}), 400
 
-            # Extract grid configuration
-            width = int(data.get("width", 40))
-            height = int(data.get("height", 40))
-            allow_diagonal = data.get("allow_diagonal", False)
-            diagonal_cost = data.get("diagonal_cost", 1.414)
-
-            # Set start and end first (before obstacles)
-            start = data.get("start", [0, 0])
-            end = data.get("end", [height - 1, width - 1])
-            
-            # Create grid
-            grid = Grid(width, height, allow_diagonal, diagonal_cost)
-            
-            if len(start) == 2:
-                grid.set_start(start[0], start[1])
-            if len(end) == 2:
-                grid.set_end(end[0], end[1])
-
-            # Add obstacles
-            obstacles = data.get("obstacles", [])
-            density = data.get("density")
-            
-            if density is not None:
-                # Generate random obstacles if density is provided
-                grid.add_obstacles_random(density=density)
-            else:
-                # Add specific obstacles
-                if isinstance(obstacles, list):
-                    for obstacle in obstacles:
-                        if len(obstacle) == 2:
-                            grid.add_obstacle(obstacle[0], obstacle[1])
-
-            # Create algorithms
-            algorithm_names = data.get("algorithms", ["Dijkstra", "AStar"])
-            algorithms = []
-
-            for algo_name in algorithm_names:
-                if algo_name == "Dijkstra":
-                    algorithms.append(Dijkstra(grid))
-                elif algo_name.startswith("AStar"):
-                    # Parse heuristic if provided (e.g., "AStar:manhattan")
-                    parts = algo_name.split(":")
-                    heuristic = parts[1] if len(parts) > 1 else "manhattan"
-                    algorithms.append(AStar(grid, heuristic=heuristic))
-                else:
-                    return (
-                        jsonify({"error": f"Unknown algorithm: {algo_name}"}),
-                        400,
-                    )
-
-            if not algorithms:
-                return jsonify({"error": "No valid algorithms specified"}), 400
+            grid, algorithms = _build_comparison(CompareRequest.from_json(data))
 
             # Generate comparison data
             comparison_data = generate_comparison_data(grid, algorithms)
 
-            return jsonify(comparison_data)
+            return _json_response(comparison_data)
+
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @app.route("/api/compare/stream", methods=["POST"])
+    def stream_compare_algorithms() -> Any:
+        """
+        Compare multiple algorithms on a grid, streaming the steps.
+
+        Takes the same request body as /api/compare, but answers with
+        Server-Sent Events as produced by stream_comparison_data(), sent
+        while the algorithms run. An "error" event reports a failure after
+        the stream has started.
+
+        Returns:
+            text/event-stream response.
+        """
+        try:
+            data = request.get_json()
+            if not data:
+                return jsonify({"error": "No JSON data provided"}), 400
+
+            grid, algorithms = _build_comparison(CompareRequest.from_json(data))
 
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
+        def generate() -> Iterator[str]:
+            try:
+                for event, payload in stream_comparison_data(grid, algorithms):
+                    yield f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+            except Exception as e:
+                yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+
+        return Response(
+            stream_with_context(generate()), mimetype="text/event-stream"
+        )
+
     @app.route("/api/presets", methods=["GET"])
     def get_presets() -> Any:
         """
@@ -124,49 +354,12 @@ def create_app() -> Flask:
         Returns:
             JSON with preset configurations.
         """
-        presets = {
-            "simple": {
-                "width": 30,
-                "height": 30,
-                "obstacles": [],
-                "start": [0, 0],
-                "end": [29, 29],
-                "allow_diagonal": False,
-            },
-            "maze": {
-                "width": 40,
-                "height": 40,
-                "obstacles": [
-                    # Create a simple maze pattern
-                    *[[10, i] for i in range(5, 35)],
-                    *[[20, i] for i in range(5, 35)],
-                    *[[i, 15] for i in range(5, 15)],
-                    *[[i, 25] for i in range(15, 25)],
-                ],
-                "start": [0, 0],
-                "end": [39, 39],
-                "allow_diagonal": False,
-            },
-            "random": {
-                "width": 40,
-                "height": 40,
-                "obstacles": "random",  # Special marker for random generation
-                "start": [0, 0],
-                "end": [39, 39],
-                "allow_diagonal": False,
-                "density": 0.25,
-            },
-            "open_field": {
-                "width": 50,
-                "height": 50,
-                "obstacles": [],
-                "start": [5, 5],
-                "end": [45, 45],
-                "allow_diagonal": True,
-            },
-        }
-
-        return jsonify(presets)
+        response = Response(_PRESETS_JSON, mimetype="application/json")
+        response.set_etag(_PRESETS_ETAG)
+        response.cache_control.public = True
+        response.cache_control.max_age = 3600
+        # Answers 304 Not Modified when the client's ETag still matches
+        return response.make_conditional(request)
 
     return app
 
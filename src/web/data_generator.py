@@ -1,11 +1,132 @@
 """Generate JSON data from algorithm execution for web visualization."""
 
-from typing import Any, Dict, List
+import base64
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
-from src.algorithms.base import PathfindingAlgorithm
+import numpy as np
+
+from src.algorithms._core import NUMBA_AVAILABLE, njit
 from src.graph.grid import Grid
 from src.graph.node import Node, NodeState
 
+if TYPE_CHECKING:
+    from src.algorithms.base import PathfindingAlgorithm
+
+# States reported for each step, in the order _scan_states() collects them
+_STEP_STATES = np.array(
+    [NodeState.VISITED, NodeState.FRONTIER, NodeState.PATH], dtype=np.uint8
+)
+_STEP_STATE_NAMES = ("visited", "frontier", "path")
+
+# Code that never occurs in a state array, marking cells as never reported
+_UNREPORTED = 255
+
+
+@njit(cache=True)
+def _scan_states(states, previous, codes, coords):
+    """
+    Collect the (row, col) of every changed cell whose state is one of codes.
+
+    Args:
+        states: (H, W) uint8 state codes, see Grid.state_array.
+        previous: (H, W) uint8 state codes last reported; updated in place.
+        codes: State codes to collect.
+        coords: (len(codes), H * W, 2) integer buffer receiving the
+            coordinates of the cells with each code, in row-major order.
+
+    Returns:
+        Number of cells found for each code.
+    """
+    counts = np.zeros(codes.shape[0], dtype=np.int64)
+    height, width = states.shape
+    for row in range(height):
+        for col in range(width):
+            state = states[row, col]
+            if state == previous[row, col]:
+                continue
+            previous[row, col] = state
+            for k in range(codes.shape[0]):
+                if state == codes[k]:
+                    count = counts[k]
+                    coords[k, count, 0] = row
+                    coords[k, count, 1] = col
+                    counts[k] = count + 1
+                    break
+    return counts
+
+
+def _collect_state_changes(
+    grid: Grid, previous: np.ndarray, coords: np.ndarray
+) -> List[np.ndarray]:
+    """
+    Find the cells that entered each reported state since the last call.
+
+    Args:
+        grid: The grid to analyze.
+        previous: (height, width) uint8 state codes last reported, updated
+                 in place; fill it with _UNREPORTED to list every cell.
+        coords: (3, height * width, 2) scratch buffer from
+               _new_coords_buffer().
+
+    Returns:
+        One (N, 2) array of (row, col) per entry of _STEP_STATES, with the
+        dtype of coords.
+    """
+    states = grid.state_array
+    if NUMBA_AVAILABLE:
+        counts = _scan_states(states, previous, _STEP_STATES, coords)
+        return [coords[k, : counts[k]].copy() for k in range(len(_STEP_STATES))]
+
+    changed = states != previous
+    arrays = [
+        np.argwhere(changed & (states == code)).astype(coords.dtype)
+        for code in _STEP_STATES
+    ]
+    np.copyto(previous, states)
+    return arrays
+
+
+def warm_up() -> None:
+    """
+    Compile the Numba kernels used per request, or load them from the cache.
+
+    The first call of a jitted function compiles it, which takes seconds
+    without an on-disk cache. Calling this at server start moves that cost
+    out of the first request. Does nothing when Numba is not installed.
+    """
+    if NUMBA_AVAILABLE:
+        get_node_states(Grid(4, 4))
+
+
+def _encode_array(array: np.ndarray) -> str:
+    """Encode an array's little-endian bytes as base64 text."""
+    return base64.b64encode(array.tobytes()).decode("ascii")
+
+
+def _pack_step_coords(chunks: List[np.ndarray]) -> Dict[str, Any]:
+    """
+    Pack per-step coordinate arrays into one binary buffer.
+
+    Args:
+        chunks: One (N, 2) integer array of (row, col) per step, all with
+               the same dtype.
+
+    Returns:
+        Dictionary with the base64 "coords" of all steps concatenated, its
+        "shape", and the base64 uint32 "offsets" such that the cells of
+        step i are rows offsets[i] to offsets[i + 1] of coords.
+    """
+    coords = np.concatenate(chunks)
+    coords = coords.astype(coords.dtype.newbyteorder("<"), copy=False)
+    offsets = np.zeros(len(chunks) + 1, dtype="<u4")
+    np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+    return {
+        "shape": list(coords.shape),
+        "coords": _encode_array(coords),
+        "offsets": _encode_array(offsets),
+    }
+
 
 def grid_to_dict(grid: Grid) -> Dict[str, Any]:
     """
@@ -17,12 +138,7 @@ def grid_to_dict(grid: Grid) -> Dict[str, Any]:
     Returns:
         Dictionary containing grid configuration.
     """
-    obstacles: List[List[int]] = []
-    for row in range(grid.height):
-        for col in range(grid.width):
-            node = grid.get_node(row, col)
-            if node and node.state == NodeState.OBSTACLE:
-                obstacles.append([row, col])
+    obstacles = [list(coords) for coords in grid.obstacle_coords]
 
     start: List[int] | None = None
     if grid.start_node:
@@ -52,119 +168,205 @@ def get_node_states(grid: Grid) -> Dict[str, List[List[int]]]:
     Returns:
         Dictionary with lists of node coordinates by state.
     """
-    visited: List[List[int]] = []
-    frontier: List[List[int]] = []
-    path: List[List[int]] = []
+    previous = np.full(grid.state_array.shape, _UNREPORTED, dtype=np.uint8)
+    arrays = _collect_state_changes(grid, previous, _new_coords_buffer(grid))
+    node_states: Dict[str, Any] = {
+        name: array.tolist() for name, array in zip(_STEP_STATE_NAMES, arrays)
+    }
+    if not node_states["path"]:
+        node_states["path"] = None
+    return node_states
 
-    for row in range(grid.height):
-        for col in range(grid.width):
-            node = grid.get_node(row, col)
-            if not node:
-                continue
 
-            coord = [row, col]
+def _coords_dtype(grid: Grid) -> np.dtype:
+    """Smallest integer dtype that holds every row and column of a grid."""
+    if max(grid.width, grid.height) - 1 <= np.iinfo(np.int16).max:
+        return np.dtype(np.int16)
+    return np.dtype(np.int32)
 
-            if node.state == NodeState.VISITED:
-                visited.append(coord)
-            elif node.state == NodeState.FRONTIER:
-                frontier.append(coord)
-            elif node.state == NodeState.PATH:
-                path.append(coord)
 
-    return {
-        "visited": visited,
-        "frontier": frontier,
-        "path": path if path else None,
-    }
+def _new_coords_buffer(grid: Grid) -> np.ndarray:
+    """Allocate the scratch buffer used by _collect_state_changes() for a grid."""
+    return np.empty(
+        (len(_STEP_STATES), grid.width * grid.height, 2), dtype=_coords_dtype(grid)
+    )
 
 
-def capture_algorithm_steps(
-    algorithm: PathfindingAlgorithm, grid: Grid
-) -> List[Dict[str, Any]]:
+def iter_algorithm_steps(
+    algorithm: "PathfindingAlgorithm", grid: Grid
+) -> Iterator[List[np.ndarray]]:
     """
-    Capture algorithm execution step-by-step.
+    Execute an algorithm step by step, yielding the cells changed per step.
+
+    The first item holds the full initial state; each later item holds the
+    cells that entered each reported state during one step.
 
     Args:
         algorithm: The algorithm to execute.
         grid: The grid on which the algorithm runs.
 
-    Returns:
-        List of step dictionaries, each containing the state at that step.
+    Yields:
+        One (N, 2) array of (row, col) per state in "visited", "frontier",
+        "path" order; int16, or int32 for grids too large for int16.
     """
     # Reset everything
     algorithm.reset()
     grid.reset()
     algorithm.initialize()
 
-    steps: List[Dict[str, Any]] = []
     step_count = 0
     max_steps = grid.width * grid.height * 2  # Safety limit
 
+    # State codes as last reported, and a scratch buffer for the scans
+    previous = np.full(grid.state_array.shape, _UNREPORTED, dtype=np.uint8)
+    coords = _new_coords_buffer(grid)
+
     # Capture initial state
-    node_states = get_node_states(grid)
-    steps.append(
-        {
-            "step": step_count,
-            "visited": node_states["visited"],
-            "frontier": node_states["frontier"],
-            "path": node_states["path"],
-        }
-    )
+    yield _collect_state_changes(grid, previous, coords)
 
     # Execute algorithm step by step
     while not algorithm.is_complete and step_count < max_steps:
         algorithm.step()
         step_count += 1
 
-        # Capture state after this step
-        node_states = get_node_states(grid)
-        steps.append(
-            {
-                "step": step_count,
-                "visited": node_states["visited"],
-                "frontier": node_states["frontier"],
-                "path": node_states["path"],
-            }
-        )
+        # Capture the cells that changed during this step
+        yield _collect_state_changes(grid, previous, coords)
 
-    return steps
 
-
-def algorithm_to_dict(algorithm: PathfindingAlgorithm, grid: Grid) -> Dict[str, Any]:
+def capture_algorithm_steps(
+    algorithm: "PathfindingAlgorithm", grid: Grid
+) -> Dict[str, Any]:
     """
-    Convert algorithm execution to dictionary format for JSON export.
+    Capture algorithm execution step-by-step.
+
+    Step 0 holds the full state: every visited, frontier and path cell.
+    Each later step only holds the cells that entered each of those states
+    during that step, so the payload grows with the algorithm's progress
+    rather than with grid area per step.
+
+    The cells are sent as packed (row, col) pairs rather than JSON lists,
+    as int16 or, for grids with more than 32768 rows or columns, int32 (see
+    the "dtype" field): for each state, one base64 buffer holds the cells of all steps
+    back to back, and an offsets buffer marks where each step starts (see
+    _pack_step_coords()).
 
     Args:
-        algorithm: The algorithm to convert.
-        grid: The grid on which the algorithm ran.
+        algorithm: The algorithm to execute.
+        grid: The grid on which the algorithm runs.
 
     Returns:
-        Dictionary containing algorithm name, steps, and metrics.
+        Dictionary with the step "count", the coordinate "dtype", and the
+        packed cells under "visited", "frontier" and "path".
     """
-    # Get algorithm name
+    # Cells per state for each step, starting with the initial state
+    chunks: List[List[np.ndarray]] = [[] for _ in _STEP_STATES]
+    for arrays in iter_algorithm_steps(algorithm, grid):
+        for state_chunks, array in zip(chunks, arrays):
+            state_chunks.append(array)
+
+    packed: Dict[str, Any] = {
+        "count": len(chunks[0]),
+        "dtype": _coords_dtype(grid).name,
+    }
+    for name, state_chunks in zip(_STEP_STATE_NAMES, chunks):
+        packed[name] = _pack_step_coords(state_chunks)
+    return packed
+
+
+def _algorithm_name(algorithm: "PathfindingAlgorithm") -> str:
+    """Display name of an algorithm, including the A* heuristic."""
     algo_name = algorithm.__class__.__name__
     if hasattr(algorithm, "heuristic_name"):
         algo_name += f" ({algorithm.heuristic_name})"
+    return algo_name
 
-    # Capture steps
-    steps = capture_algorithm_steps(algorithm, grid)
 
-    # Get final metrics
+def _algorithm_metrics(algorithm: "PathfindingAlgorithm") -> Dict[str, Any]:
+    """Final metrics of an algorithm as sent to the frontend."""
     metrics = algorithm.get_metrics()
+    return {
+        "nodes_visited": metrics["nodes_visited"],
+        "path_length": metrics["path_length"],
+        "path_found": metrics["path_found"],
+    }
+
+
+def algorithm_to_dict(algorithm: "PathfindingAlgorithm", grid: Grid) -> Dict[str, Any]:
+    """
+    Convert algorithm execution to dictionary format for JSON export.
+
+    Args:
+        algorithm: The algorithm to convert.
+        grid: The grid on which the algorithm ran.
 
+    Returns:
+        Dictionary containing algorithm name, steps, and metrics.
+    """
+    steps = capture_algorithm_steps(algorithm, grid)
     return {
-        "name": algo_name,
+        "name": _algorithm_name(algorithm),
         "steps": steps,
-        "metrics": {
-            "nodes_visited": metrics["nodes_visited"],
-            "path_length": metrics["path_length"],
-            "path_found": metrics["path_found"],
-        },
+        "metrics": _algorithm_metrics(algorithm),
     }
 
 
+def _detached_payload(
+    algorithm: "PathfindingAlgorithm", grid: Grid
+) -> Optional[tuple]:
+    """
+    Describe an algorithm run so it can be captured in another process.
+
+    Args:
+        algorithm: The algorithm to describe.
+        grid: The grid the algorithm runs on.
+
+    Returns:
+        Payload for _capture_detached(), or None if the algorithm cannot be
+        rebuilt from picklable arguments (e.g. a custom heuristic).
+    """
+    kwargs: Dict[str, Any] = {}
+    if hasattr(algorithm, "heuristic_name"):
+        if algorithm.heuristic_name == "custom":
+            return None
+        kwargs["heuristic"] = algorithm.heuristic_name
+        kwargs["bidirectional"] = algorithm.bidirectional
+
+    start = (grid.start_node.row, grid.start_node.col) if grid.start_node else None
+    end = (grid.end_node.row, grid.end_node.col) if grid.end_node else None
+    obstacles = np.flatnonzero(grid.obstacle_mask).tolist()
+    grid_config = (grid.width, grid.height, grid.allow_diagonal, grid.diagonal_cost)
+    return grid_config, obstacles, start, end, type(algorithm), kwargs
+
+
+def _capture_detached(payload: tuple) -> Dict[str, Any]:
+    """
+    Rebuild an algorithm run from its payload and convert it to a dictionary.
+
+    Used as the worker function of the process pool in
+    generate_comparison_data().
+
+    Args:
+        payload: Tuple (grid_config, obstacles, start, end, algorithm_class,
+                 kwargs) as built by _detached_payload().
+
+    Returns:
+        The result of algorithm_to_dict() for the rebuilt run.
+    """
+    grid_config, obstacles, start, end, algorithm_class, kwargs = payload
+    grid = Grid(*grid_config)
+    grid.arrays.state.ravel()[obstacles] = NodeState.OBSTACLE
+    if start is not None:
+        grid.set_start(*start)
+    if end is not None:
+        grid.set_end(*end)
+
+    return algorithm_to_dict(algorithm_class(grid, **kwargs), grid)
+
+
 def generate_comparison_data(
-    grid: Grid, algorithms: List[PathfindingAlgorithm]
+    grid: Grid,
+    algorithms: List["PathfindingAlgorithm"],
+    parallel: bool = False,
 ) -> Dict[str, Any]:
     """
     Generate comparison data for multiple algorithms.
@@ -172,40 +374,46 @@ def generate_comparison_data(
     Args:
         grid: The base grid (will be cloned for each algorithm).
         algorithms: List of algorithm instances to compare.
+        parallel: If True, capture the algorithms in a process pool. Runs
+                 that cannot be sent to another process stay local, and
+                 the algorithm instances of detached runs are left unrun.
+                 Starting the pool costs more than capturing small grids,
+                 so this only pays off for large grids.
 
     Returns:
         Dictionary containing grid and algorithm data.
     """
-    from src.graph.grid import Grid as GridClass
-
     # Create separate grids for each algorithm
-    grids: List[GridClass] = []
-    for _ in algorithms:
-        new_grid = GridClass(
-            grid.width, grid.height, grid.allow_diagonal, grid.diagonal_cost
-        )
-        # Copy obstacles
-        for row in range(grid.height):
-            for col in range(grid.width):
-                node = grid.get_node(row, col)
-                if node and node.state == NodeState.OBSTACLE:
-                    new_grid.add_obstacle(row, col)
-        # Copy start and end
-        if grid.start_node:
-            new_grid.set_start(grid.start_node.row, grid.start_node.col)
-        if grid.end_node:
-            new_grid.set_end(grid.end_node.row, grid.end_node.col)
-        grids.append(new_grid)
+    grids: List[Grid] = [grid.clone() for _ in algorithms]
 
     # Update algorithms to use their respective grids
     for i, algo in enumerate(algorithms):
         algo.grid = grids[i]
 
+    payloads = [
+        _detached_payload(algo, algo_grid) if parallel else None
+        for algo, algo_grid in zip(algorithms, grids)
+    ]
+    detached = [i for i, payload in enumerate(payloads) if payload is not None]
+    if len(detached) < 2:
+        detached = []
+
     # Generate data for each algorithm
-    algorithm_data = []
-    for algo, algo_grid in zip(algorithms, grids):
-        algo_data = algorithm_to_dict(algo, algo_grid)
-        algorithm_data.append(algo_data)
+    algorithm_data: List[Optional[Dict[str, Any]]] = [None] * len(algorithms)
+    local = [i for i in range(len(algorithms)) if i not in detached]
+    if detached:
+        with ProcessPoolExecutor(max_workers=len(detached)) as executor:
+            pending = [
+                executor.submit(_capture_detached, payloads[i]) for i in detached
+            ]
+            # Capture what has to stay local while the pool works
+            for i in local:
+                algorithm_data[i] = algorithm_to_dict(algorithms[i], grids[i])
+            for i, future in zip(detached, pending):
+                algorithm_data[i] = future.result()
+    else:
+        for i in local:
+            algorithm_data[i] = algorithm_to_dict(algorithms[i], grids[i])
 
     # Get grid data (use first grid as they're all the same structure)
     grid_data = grid_to_dict(grids[0])
@@ -215,3 +423,60 @@ def generate_comparison_data(
         "algorithms": algorithm_data,
     }
 
+
+def stream_comparison_data(
+    grid: Grid, algorithms: List["PathfindingAlgorithm"]
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Generate comparison data as a stream of events.
+
+    Unlike generate_comparison_data(), nothing is accumulated: the
+    algorithms advance in lockstep and each step is yielded as soon as it
+    has been captured, so memory use does not grow with the number of steps
+    and clients can render while the search is still running.
+
+    The events are, in order: one "grid" event with the grid_to_dict()
+    data; one "algorithm" event per algorithm with its "index" and "name";
+    "step" events with the algorithm "index", the "step" number and the
+    [row, col] lists of the cells that entered the "visited", "frontier"
+    and "path" states (step 0 lists the full initial state); and one
+    "metrics" event per algorithm once it has finished.
+
+    Args:
+        grid: The base grid (will be cloned for each algorithm).
+        algorithms: List of algorithm instances to compare.
+
+    Yields:
+        Tuples (event name, event data).
+    """
+    grids: List[Grid] = [grid.clone() for _ in algorithms]
+    for algo, algo_grid in zip(algorithms, grids):
+        algo.grid = algo_grid
+
+    yield "grid", grid_to_dict(grids[0])
+    for index, algo in enumerate(algorithms):
+        yield "algorithm", {"index": index, "name": _algorithm_name(algo)}
+
+    running = [
+        (index, iter_algorithm_steps(algo, algo_grid))
+        for index, (algo, algo_grid) in enumerate(zip(algorithms, grids))
+    ]
+    step_count = 0
+    while running:
+        still_running = []
+        for index, steps in running:
+            arrays = next(steps, None)
+            if arrays is None:
+                yield "metrics", {
+                    "index": index,
+                    **_algorithm_metrics(algorithms[index]),
+                }
+                continue
+
+            event: Dict[str, Any] = {"index": index, "step": step_count}
+            for name, array in zip(_STEP_STATE_NAMES, arrays):
+                event[name] = array.tolist()
+            yield "step", event
+            still_running.append((index, steps))
+        running = still_running
+        step_count += 1
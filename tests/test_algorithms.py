@@ -2,8 +2,10 @@
 
 import pytest
 
-from src.algorithms import AStar, Dijkstra
-from src.graph import Grid
+from src.algorithms import AStar, Dijkstra, _core
+from src.algorithms.queues import BucketQueue
+from src.graph import Grid, NodeState
+from src.utils.metrics import measure_algorithm
 
 
 class TestDijkstra:
@@ -73,6 +75,73 @@ class TestDijkstra:
         assert metrics["path_found"] is True
         assert metrics["nodes_visited"] > 0
 
+    def test_bucket_queue_order(self):
+        """Test that BucketQueue pops by priority, then insertion order."""
+        queue = BucketQueue()
+        for priority, item in [(2, 10), (0, 11), (2, 12), (1, 13)]:
+            queue.push(priority, item)
+
+        assert queue.pop() == (0, 11)
+        queue.push(1, 14)
+        assert [queue.pop() for _ in range(4)] == [(1, 13), (1, 14), (2, 10), (2, 12)]
+        assert len(queue) == 0
+        with pytest.raises(IndexError):
+            queue.pop()
+
+    def test_integer_costs_use_bucket_queue(self):
+        """Test that small integer edge costs switch to the bucket queue."""
+        cases = [(2.0, BucketQueue, 18.0), (1.5, list, 13.5), (1e9, list, 18.0)]
+        for diagonal_cost, queue_type, cost in cases:
+            grid = Grid(10, 10, allow_diagonal=True, diagonal_cost=diagonal_cost)
+            grid.set_start(0, 0)
+            grid.set_end(9, 9)
+
+            dijkstra = Dijkstra(grid)
+            assert dijkstra.find_path() is not None
+            assert isinstance(dijkstra.priority_queue, queue_type)
+            assert dijkstra.costs[9 * grid.width + 9] == cost
+
+    @pytest.mark.skipif(not _core.NUMBA_AVAILABLE, reason="numba not installed")
+    @pytest.mark.parametrize("diagonal_cost", [0.25, 0.5])
+    def test_fractional_diagonal_cost_is_optimal(self, diagonal_cost):
+        """Test that fractional diagonal costs keep the heap and optimal paths."""
+        for seed in (12, 56):
+            grid = Grid(12, 12, allow_diagonal=True, diagonal_cost=diagonal_cost)
+            grid.set_start(0, 0)
+            grid.set_end(11, 11)
+            grid.add_obstacles_random(density=0.3, seed=seed)
+
+            # Attaching a callback forces the interpreted step loop
+            interpreted = Dijkstra(grid)
+            interpreted.on_node_visited = lambda node: None
+            interpreted_cost = measure_algorithm(interpreted).path_cost
+            assert isinstance(interpreted.priority_queue, list)
+
+            compiled_cost = measure_algorithm(Dijkstra(grid)).path_cost
+            assert interpreted_cost == pytest.approx(compiled_cost)
+
+    @pytest.mark.skipif(not _core.NUMBA_AVAILABLE, reason="numba not installed")
+    @pytest.mark.parametrize("allow_diagonal", [False, True])
+    def test_compiled_kernel_matches_interpreter(self, allow_diagonal):
+        """Test that the compiled kernel explores exactly like the Python loop."""
+        grid = Grid(20, 20, allow_diagonal=allow_diagonal)
+        grid.set_start(0, 0)
+        grid.set_end(19, 19)
+        grid.add_obstacles_random(density=0.2, seed=4)
+
+        dijkstra = Dijkstra(grid)
+        compiled_path = dijkstra.find_path()
+        compiled_states = grid.state_array.copy()
+        compiled_costs = dijkstra.costs
+
+        # Attaching a callback forces the interpreted step loop
+        dijkstra.on_node_visited = lambda node: None
+        interpreted_path = dijkstra.find_path()
+
+        assert compiled_path == interpreted_path
+        assert (compiled_states == grid.state_array).all()
+        assert compiled_costs == dijkstra.costs
+
 
 class TestAStar:
     """Test cases for A* algorithm."""
@@ -187,6 +256,62 @@ class TestAStar:
         assert metrics["path_found"] is True
         assert metrics["nodes_visited"] > 0
 
+    # Seed 5 leaves the goal unreachable
+    @pytest.mark.parametrize("seed", [4, 5, 7])
+    def test_bidirectional_matches_unidirectional(self, seed):
+        """Test that bidirectional search finds an equally short path."""
+        grid = Grid(30, 30)
+        grid.set_start(0, 0)
+        grid.set_end(29, 29)
+        grid.add_obstacles_random(density=0.2, seed=seed)
+
+        astar = AStar(grid, heuristic="manhattan")
+        path = astar.find_path()
+
+        bidirectional = AStar(grid, heuristic="manhattan", bidirectional=True)
+        bidirectional_path = bidirectional.find_path()
+
+        assert (path is None) == (bidirectional_path is None)
+        if path is not None:
+            assert len(bidirectional_path) == len(path)
+            assert bidirectional_path[0] == grid.start_node
+            assert bidirectional_path[-1] == grid.end_node
+            for a, b in zip(bidirectional_path, bidirectional_path[1:]):
+                assert abs(a.row - b.row) + abs(a.col - b.col) == 1
+
+    def test_bidirectional_open_grid(self):
+        """Test that bidirectional search expands few nodes on an open grid."""
+        grid = Grid(30, 30)
+        grid.set_start(0, 0)
+        grid.set_end(29, 29)
+
+        astar = AStar(grid, heuristic="manhattan", bidirectional=True)
+        path = astar.find_path()
+
+        assert path is not None
+        assert len(path) == 59
+        assert astar.get_metrics()["nodes_visited"] < 30 * 30 // 4
+
+    @pytest.mark.skipif(not _core.NUMBA_AVAILABLE, reason="numba not installed")
+    @pytest.mark.parametrize("heuristic", ["manhattan", "euclidean", "chebyshev"])
+    def test_compiled_kernel_matches_interpreter(self, heuristic):
+        """Test that the compiled kernel explores exactly like the Python loop."""
+        grid = Grid(20, 20, allow_diagonal=heuristic == "chebyshev")
+        grid.set_start(0, 0)
+        grid.set_end(19, 19)
+        grid.add_obstacles_random(density=0.2)
+
+        astar = AStar(grid, heuristic=heuristic)
+        compiled_path = astar.find_path()
+        compiled_visited = astar.get_metrics()["nodes_visited"]
+
+        # Attaching a callback forces the interpreted step loop
+        astar.on_node_visited = lambda node: None
+        interpreted_path = astar.find_path()
+
+        assert compiled_path == interpreted_path
+        assert compiled_visited == astar.get_metrics()["nodes_visited"]
+
 
 class TestAlgorithmComparison:
     """Test cases comparing different algorithms."""
@@ -230,3 +355,75 @@ class TestAlgorithmComparison:
         # (This is probabilistic, so we allow some tolerance)
         assert astar_visited <= dijkstra_visited * 1.5
 
+    def test_measure_algorithm_rejects_broken_path(self):
+        """Test that path cost is not computed over non-adjacent path nodes."""
+        grid = Grid(5, 5, allow_diagonal=True)
+        grid.set_start(0, 0)
+        grid.set_end(4, 4)
+
+        metrics = measure_algorithm(Dijkstra(grid))
+        assert metrics.path_cost == pytest.approx(4 * grid.diagonal_cost)
+
+        class SkippingDijkstra(Dijkstra):
+            def find_path(self):
+                path = super().find_path()
+                self.path = path[::2]
+                return self.path
+
+        with pytest.raises(ValueError):
+            measure_algorithm(SkippingDijkstra(grid))
+
+    @pytest.mark.parametrize("algorithm_cls", [Dijkstra, AStar])
+    @pytest.mark.parametrize("use_setter", [True, False])
+    def test_node_obstacle_between_searches(self, algorithm_cls, use_setter):
+        """Test that obstacles set through nodes are seen by the next search."""
+        grid = Grid(5, 3)
+        grid.set_start(1, 0)
+        grid.set_end(1, 4)
+        assert len(algorithm_cls(grid).find_path()) == 5
+
+        for row in (0, 1):
+            node = grid.get_node(row, 2)
+            if use_setter:
+                node.set_obstacle(True)
+            else:
+                node.state = NodeState.OBSTACLE
+
+        path = algorithm_cls(grid).find_path()
+        assert path is not None
+        assert all(node.is_traversable() for node in path)
+        assert len(path) == 7
+
+    @pytest.mark.parametrize("algorithm_cls", [Dijkstra, AStar])
+    def test_toggle_diagonal_between_searches(self, algorithm_cls):
+        """Test that changing the movement rules is seen by the next search."""
+        grid = Grid(5, 5)
+        grid.set_start(0, 0)
+        grid.set_end(4, 4)
+        assert len(algorithm_cls(grid).find_path()) == 9
+
+        grid.allow_diagonal = True
+        assert len(algorithm_cls(grid).find_path()) == 5
+
+        grid.allow_diagonal = False
+        assert len(algorithm_cls(grid).find_path()) == 9
+
+    @pytest.mark.parametrize("algorithm_cls", [Dijkstra, AStar])
+    @pytest.mark.parametrize("with_callback", [False, True])
+    def test_node_costs_after_search(self, algorithm_cls, with_callback):
+        """Test that nodes report the final costs once a search completes."""
+        grid = Grid(5, 5)
+        grid.set_start(0, 0)
+        grid.set_end(4, 4)
+        grid.add_obstacle(0, 4)
+
+        algorithm = algorithm_cls(grid)
+        if with_callback:
+            algorithm.on_node_visited = lambda node: None
+        path = algorithm.find_path()
+
+        assert grid.end_node.g_cost == 8.0
+        assert grid.end_node.cost == 8.0
+        assert grid.end_node.f_cost == 8.0
+        assert [node.g_cost for node in path] == [float(i) for i in range(9)]
+        assert grid.get_node(0, 4).g_cost == float("inf")
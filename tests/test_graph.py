@@ -3,7 +3,7 @@
 import pytest
 
 from src.graph.grid import Grid
-from src.graph.node import Node, NodeState
+from src.graph.node import STATE_CODES, Node, NodeState
 
 
 class TestNode:
@@ -145,6 +145,61 @@ class TestGrid:
         assert (4, 5) not in neighbor_positions
         assert (6, 5) not in neighbor_positions
 
+    def test_edge_cost_matches_get_neighbors(self):
+        """Test that edge_cost agrees with get_neighbors for every pair."""
+        for allow_diagonal in (False, True):
+            grid = Grid(5, 5, allow_diagonal=allow_diagonal)
+            grid.add_obstacle(1, 2)
+            center = grid.get_node(2, 2)
+            costs = {n: cost for n, cost in grid.get_neighbors(center)}
+
+            for row in grid.nodes:
+                for node in row:
+                    assert grid.edge_cost(center, node) == costs.get(node)
+
+    def test_adjacency_matches_get_neighbors(self):
+        """Test that the cached adjacency agrees with get_neighbors."""
+        grid = Grid(8, 6, allow_diagonal=True)
+        grid.add_obstacle(2, 3)
+        grid.add_obstacle(4, 4)
+
+        for row in grid.nodes:
+            for node in row:
+                index = node.row * grid.width + node.col
+                expected = [
+                    (neighbor.row * grid.width + neighbor.col, cost)
+                    for neighbor, cost in grid.get_neighbors(node)
+                ]
+                assert grid.neighbors_at(index) == expected
+
+    def test_adjacency_invalidated_by_obstacles(self):
+        """Test that obstacle edits rebuild the cached adjacency."""
+        grid = Grid(5, 5)
+        center = 2 * grid.width + 2
+        assert len(grid.neighbors_at(center)) == 4
+
+        grid.add_obstacle(1, 2)
+        assert len(grid.neighbors_at(center)) == 3
+
+        grid.remove_obstacle(1, 2)
+        assert len(grid.neighbors_at(center)) == 4
+
+    def test_state_array_tracks_node_states(self):
+        """Test that state_array mirrors every node state change."""
+        grid = Grid(4, 3)
+        grid.set_start(0, 0)
+        grid.add_obstacle(1, 2)
+        grid.get_node(2, 3).state = NodeState.VISITED
+
+        assert grid.state_array.shape == (3, 4)
+        assert grid.state_array[0, 0] == STATE_CODES[NodeState.START]
+        assert grid.state_array[1, 2] == STATE_CODES[NodeState.OBSTACLE]
+        assert grid.state_array[2, 3] == STATE_CODES[NodeState.VISITED]
+
+        grid.reset()
+        assert grid.state_array[2, 3] == STATE_CODES[NodeState.UNVISITED]
+        assert grid.state_array[1, 2] == STATE_CODES[NodeState.OBSTACLE]
+
     def test_random_obstacles(self):
         """Test random obstacle placement."""
         grid = Grid(20, 20)
@@ -164,6 +219,31 @@ class TestGrid:
         expected_max = int(total_cells * 0.35)
         assert expected_min <= obstacle_count <= expected_max
 
+    def test_nodes_are_views_of_arrays(self):
+        """Test that nodes read and write the grid's per-cell arrays."""
+        grid = Grid(4, 3)
+        node = grid.get_node(1, 2)
+        node.g_cost = 3.5
+        node.parent = grid.get_node(1, 1)
+
+        assert grid.arrays.g_cost[1, 2] == 3.5
+        assert grid.arrays.parent[1, 2] == 1 * grid.width + 1
+        assert node.parent is grid.get_node(1, 1)
+
+        grid.reset()
+        assert node.g_cost == float("inf")
+        assert node.parent is None
+
+    def test_random_obstacles_seed(self):
+        """Test that a seed reproduces the same obstacle layout."""
+        layouts = []
+        for _ in range(2):
+            grid = Grid(15, 15)
+            grid.add_obstacles_random(density=0.3, seed=42)
+            layouts.append(grid.state_array.copy())
+
+        assert (layouts[0] == layouts[1]).all()
+
     def test_path_reconstruction(self):
         """Test path reconstruction."""
         grid = Grid(5, 5)
@@ -203,3 +283,94 @@ class TestGrid:
         # Modified node should be reset
         assert grid.get_node(3, 3).cost == float("inf")
 
+    def test_clone(self):
+        """Test that clone copies the configuration but not the search state."""
+        grid = Grid(6, 4, allow_diagonal=True)
+        grid.set_start(0, 0)
+        grid.set_end(3, 5)
+        grid.add_obstacles_random(density=0.3, seed=7)
+        grid.get_node(1, 1).state = NodeState.VISITED
+
+        clone = grid.clone()
+        assert clone.allow_diagonal
+        assert (clone.obstacle_mask == grid.obstacle_mask).all()
+        assert clone.start_node == grid.start_node
+        assert clone.end_node == grid.end_node
+        assert clone.get_node(1, 1).state == NodeState.UNVISITED
+
+    def test_clone_from(self):
+        """Test copying a configuration onto an existing grid."""
+        source = Grid(6, 4)
+        source.set_start(0, 0)
+        source.set_end(3, 5)
+        source.add_obstacles_random(density=0.3, seed=3)
+
+        target = Grid(6, 4)
+        target.set_start(1, 1)
+        target.add_obstacle(2, 2)
+        target.get_node(0, 1).state = NodeState.VISITED
+        target.clone_from(source)
+
+        assert (target.state_array == source.state_array).all()
+        assert target.start_node == source.start_node
+        assert target.end_node == source.end_node
+
+        with pytest.raises(ValueError):
+            Grid(5, 4).clone_from(source)
+
+    def test_obstacle_coords_follow_edits(self):
+        """Test that the cached obstacle list is invalidated by obstacle edits."""
+        grid = Grid(5, 5)
+        grid.add_obstacle(3, 1)
+        grid.add_obstacle(1, 4)
+        assert grid.obstacle_coords == ((1, 4), (3, 1))
+
+        grid.remove_obstacle(1, 4)
+        assert grid.obstacle_coords == ((3, 1),)
+        assert grid.obstacle_count == 1
+
+        grid.clear_obstacles()
+        assert grid.obstacle_count == 0
+
+    def test_add_obstacles(self):
+        """Test that add_obstacles matches add_obstacle on each position."""
+        positions = [(0, 1), (2, 3), (9, 9), (-1, 0), (3, 1)]
+        bulk = Grid(5, 4)
+        assert bulk.add_obstacles(positions) == 3
+
+        single = Grid(5, 4)
+        for row, col in positions:
+            single.add_obstacle(row, col)
+
+        assert (bulk.state_array == single.state_array).all()
+        assert bulk.obstacle_count == 3
+        assert bulk.add_obstacles([]) == 0
+
+    def test_node_views_are_created_once(self):
+        """Test that each cell always returns the same Node view."""
+        grid = Grid(4, 3)
+        node = grid.get_node(2, 1)
+        assert grid.get_node(2, 1) is node
+        assert grid.nodes[2][1] is node
+        assert grid.flat_nodes[2 * grid.width + 1] is node
+        assert len(grid.flat_nodes) == 12
+        assert [n.col for n in grid.flat_nodes][:5] == [0, 1, 2, 3, 0]
+
+        with pytest.raises(IndexError):
+            grid.flat_nodes[12]
+
+    def test_flat_nodes_behave_like_a_list(self):
+        """Test membership and slicing on the flat node sequence."""
+        grid = Grid(4, 3)
+        flat_nodes = grid.flat_nodes
+
+        assert grid.get_node(2, 3) in flat_nodes
+        assert Node(1, 1) in flat_nodes
+        assert Node(3, 0) not in flat_nodes
+        assert 0 not in flat_nodes
+
+        assert flat_nodes[0:2] == [grid.get_node(0, 0), grid.get_node(0, 1)]
+        assert flat_nodes[-1] is grid.get_node(2, 3)
+        assert flat_nodes[::5] == [flat_nodes[0], flat_nodes[5], flat_nodes[10]]
+        assert list(flat_nodes) == [node for row in grid.nodes for node in row]
+        assert flat_nodes.index(grid.get_node(1, 2)) == 6
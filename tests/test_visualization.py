@@ -0,0 +1,53 @@
+"""Unit tests for the visualization helpers."""
+
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+from matplotlib.backend_bases import FigureCanvasBase  # noqa: E402
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+from matplotlib.image import AxesImage  # noqa: E402
+
+from src.algorithms import AStar, Dijkstra  # noqa: E402
+from src.graph import Grid  # noqa: E402
+from src.visualization.comparator import Comparator  # noqa: E402
+
+
+class TestComparator:
+    """Test cases for the Comparator."""
+
+    def test_step_by_step_draws_images_without_blitting(self, monkeypatch):
+        """Test that grids are drawn during the loop on non-blitting canvases."""
+        monkeypatch.setattr(FigureCanvasAgg, "supports_blit", False)
+        monkeypatch.setattr(plt, "show", lambda *args, **kwargs: None)
+
+        drawn = []
+        draw_image = AxesImage.draw
+
+        def counting_draw(image, renderer):
+            drawn.append(image)
+            return draw_image(image, renderer)
+
+        monkeypatch.setattr(AxesImage, "draw", counting_draw)
+
+        # Render the pending draw_idle() at each refresh instead of waiting
+        refreshes = []
+
+        def refresh(canvas, timeout=0):
+            drawn.clear()
+            canvas.draw()
+            refreshes.append(len(drawn))
+
+        monkeypatch.setattr(FigureCanvasBase, "start_event_loop", refresh)
+
+        grid = Grid(4, 3)
+        grid.set_start(0, 0)
+        grid.set_end(2, 3)
+        comparator = Comparator(grid, [Dijkstra(grid), AStar(grid)])
+        comparator.compare_step_by_step(interval=0, steps_per_frame=1)
+        plt.close("all")
+
+        assert refreshes
+        assert all(count == 2 for count in refreshes)
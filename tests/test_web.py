@@ -0,0 +1,182 @@
+"""Unit tests for the web data generation."""
+
+import base64
+import json
+
+import numpy as np
+import pytest
+
+from src.algorithms import AStar, Dijkstra
+from src.graph import Grid
+from src.web import api
+from src.web.data_generator import (
+    capture_algorithm_steps,
+    generate_comparison_data,
+)
+
+
+class TestDataGenerator:
+    """Test cases for the comparison data generator."""
+
+    def test_step_coords_dtype_fits_grid(self):
+        """Test that coordinates beyond the int16 range are sent as int32."""
+        grid = Grid(6, 4)
+        grid.set_start(0, 0)
+        grid.set_end(3, 5)
+        assert capture_algorithm_steps(AStar(grid), grid)["dtype"] == "int16"
+
+        tall = Grid(1, 40_000)
+        tall.set_start(39_990, 0)
+        tall.set_end(39_999, 0)
+        dijkstra = Dijkstra(tall)
+        steps = capture_algorithm_steps(dijkstra, tall)
+        assert steps["dtype"] == "int32"
+
+        coords = np.frombuffer(
+            base64.b64decode(steps["visited"]["coords"]), dtype="<i4"
+        ).reshape(-1, 2)
+        # Start and end keep their own states and are not listed as visited
+        visited = [node.row for node in dijkstra.visited_nodes[1:-1]]
+        assert sorted(coords[:, 0].tolist()) == sorted(visited)
+        assert (coords[:, 1] == 0).all()
+
+    def test_parallel_capture_matches_serial(self):
+        """Test that the process pool returns the same payload as serial capture."""
+        grid = Grid(12, 10, allow_diagonal=True)
+        grid.set_start(0, 0)
+        grid.set_end(9, 11)
+        grid.add_obstacles_random(density=0.2, seed=5)
+
+        def run(parallel):
+            algorithms = [Dijkstra(grid), AStar(grid, heuristic="chebyshev")]
+            return generate_comparison_data(grid, algorithms, parallel=parallel)
+
+        assert run(parallel=True) == run(parallel=False)
+
+
+class TestApi:
+    """Test cases for the Flask API routes."""
+
+    @pytest.fixture
+    def client(self):
+        """Flask test client for a fresh app."""
+        return api.create_app().test_client()
+
+    @staticmethod
+    def _read_events(response):
+        """Split a Server-Sent Events body into (event, data) pairs."""
+        events = []
+        for message in response.get_data(as_text=True).split("\n\n"):
+            if not message:
+                continue
+            event_line, data_line = message.split("\n")
+            assert event_line.startswith("event: ")
+            assert data_line.startswith("data: ")
+            events.append((event_line[7:], json.loads(data_line[6:])))
+        return events
+
+    def test_compare_stream_event_order(self, client):
+        """Test that the stream sends grid, algorithms, steps, then metrics."""
+        response = client.post(
+            "/api/compare/stream",
+            json={
+                "width": 8,
+                "height": 6,
+                "obstacles": [[2, 3], [3, 3]],
+                "algorithms": ["Dijkstra", "AStar"],
+            },
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+
+        events = self._read_events(response)
+        names = [event for event, _ in events]
+        assert names[:3] == ["grid", "algorithm", "algorithm"]
+        assert set(names[3:]) == {"step", "metrics"}
+        assert names[-1] == "metrics"
+        assert [data["name"] for _, data in events[1:3]] == [
+            "Dijkstra",
+            "AStar (manhattan)",
+        ]
+
+        for index in (0, 1):
+            own = [name for name, data in events[3:] if data["index"] == index]
+            # Each algorithm's metrics follow all of its steps
+            assert own[-1] == "metrics"
+            assert own.count("metrics") == 1
+            assert own[0] == "step"
+
+    def test_compare_stream_reports_error_event(self, client, monkeypatch):
+        """Test that a failure after the stream started becomes an error event."""
+
+        def failing_stream(grid, algorithms):
+            yield "grid", {"width": grid.width}
+            raise RuntimeError("search failed")
+
+        monkeypatch.setattr(api, "stream_comparison_data", failing_stream)
+        response = client.post("/api/compare/stream", json={"width": 5, "height": 5})
+
+        assert response.status_code == 200
+        assert self._read_events(response) == [
+            ("grid", {"width": 5}),
+            ("error", {"error": "search failed"}),
+        ]
+
+    def test_presets_etag_and_cache_control(self, client):
+        """Test that presets are cacheable and revalidate with a 304."""
+        response = client.get("/api/presets")
+        assert response.status_code == 200
+        assert json.loads(response.data) == api.PRESETS
+        etag, _ = response.get_etag()
+        assert etag == api._PRESETS_ETAG
+        assert response.cache_control.public
+        assert response.cache_control.max_age == 3600
+
+        cached = client.get("/api/presets", headers={"If-None-Match": f'"{etag}"'})
+        assert cached.status_code == 304
+        assert cached.data == b""
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {"width": "wide"},
+            {"height": [10]},
+            {"allow_diagonal": "false"},
+            {"allow_diagonal": 0},
+        ],
+    )
+    def test_compare_rejects_bad_types(self, client, body):
+        """Test that fields of the wrong type are answered with a 400."""
+        response = client.post("/api/compare", json=body)
+        assert response.status_code == 400
+        assert response.get_json()["error"].startswith("Invalid request")
+
+    def test_compare_request_obstacles(self):
+        """Test that malformed obstacles are dropped rather than rejected."""
+        params = api.CompareRequest.from_json(
+            {"obstacles": [[1, 2], [3], [4, 5, 6], [7, 8]]}
+        )
+        assert params.obstacles.tolist() == [[1, 2], [7, 8]]
+
+        params = api.CompareRequest.from_json({"obstacles": "random"})
+        assert params.obstacles.shape == (0, 2)
+
+        assert api.CompareRequest.from_json({"allow_diagonal": True}).allow_diagonal
+
+    @pytest.mark.skipif(api.orjson is None, reason="orjson not installed")
+    def test_compare_json_fallback_matches_orjson(self, client, monkeypatch):
+        """Test that the jsonify fallback sends the same data as orjson."""
+        body = {
+            "width": 10,
+            "height": 8,
+            "obstacles": [[3, 4], [4, 4], [5, 4]],
+            "allow_diagonal": True,
+        }
+        fast = client.post("/api/compare", json=body)
+
+        monkeypatch.setattr(api, "orjson", None)
+        fallback = client.post("/api/compare", json=body)
+
+        assert fast.status_code == fallback.status_code == 200
+        assert fast.mimetype == fallback.mimetype == "application/json"
+        assert json.loads(fast.data) == json.loads(fallback.data)
@@ -3,6 +3,47 @@
  * Handles canvas rendering, step-by-step animation, and synchronization.
  */
 
+// Codes stored in AlgorithmVisualizer.cellStates
+const CELL_STATES = {
+    unvisited: 0,
+    visited: 1,
+    frontier: 2,
+    path: 3
+};
+
+/**
+ * Decode base64 text into an ArrayBuffer.
+ */
+function decodeBase64(text) {
+    const binary = atob(text);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes.buffer;
+}
+
+/**
+ * Unpack the step cells sent by capture_algorithm_steps().
+ *
+ * For each state, coords holds the (row, col) pairs of all steps back to
+ * back as little-endian integers of steps.dtype ("int16", or "int32" for
+ * very large grids), and the cells of step i are the pairs
+ * offsets[i] to offsets[i + 1]. Typed arrays use the platform's byte
+ * order, which is little-endian on every browser platform.
+ */
+function decodeSteps(steps) {
+    const decoded = {count: steps.count};
+    const CoordsArray = steps.dtype === 'int32' ? Int32Array : Int16Array;
+    ['visited', 'frontier', 'path'].forEach(name => {
+        decoded[name] = {
+            coords: new CoordsArray(decodeBase64(steps[name].coords)),
+            offsets: new Uint32Array(decodeBase64(steps[name].offsets))
+        };
+    });
+    return decoded;
+}
+
 class AlgorithmVisualizer {
     constructor(canvas, gridData, algorithmData) {
         this.canvas = canvas;
@@ -22,7 +63,20 @@ class AlgorithmVisualizer {
         
         // Current step
         this.currentStep = 0;
-        this.maxSteps = algorithmData.steps.length - 1;
+        this.steps = decodeSteps(algorithmData.steps);
+        this.maxSteps = this.steps.count - 1;
+        
+        // Per-cell state, rebuilt by replaying the step deltas
+        const numCells = gridData.width * gridData.height;
+        this.cellStates = new Uint8Array(numCells);
+        this.visitRank = new Int32Array(numCells);
+        this.visitedCount = 0;
+        this.appliedStep = -1;
+        
+        this.obstacleMask = new Uint8Array(numCells);
+        (gridData.obstacles || []).forEach(([row, col]) => {
+            this.obstacleMask[row * gridData.width + col] = 1;
+        });
         
         // Color mapping
         this.colors = {
@@ -46,7 +100,7 @@ class AlgorithmVisualizer {
      */
     render() {
         const ctx = this.ctx;
-        const step = this.algorithmData.steps[this.currentStep];
+        this.seekTo(this.currentStep);
         
         // Clear canvas
         ctx.clearRect(0, 0, this.canvas.width, this.canvas.height);
@@ -54,19 +108,59 @@ class AlgorithmVisualizer {
         // Draw grid cells
         for (let row = 0; row < this.gridData.height; row++) {
             for (let col = 0; col < this.gridData.width; col++) {
-                this.drawCell(row, col, step);
+                this.drawCell(row, col);
             }
         }
     }
     
+    /**
+     * Bring cellStates to the state after the given step.
+     *
+     * Step 0 lists every visited, frontier and path cell; later steps only
+     * list the cells that changed to each state. Moving forward applies the
+     * new steps; moving backward replays from step 0.
+     */
+    seekTo(target) {
+        if (target < this.appliedStep) {
+            this.cellStates.fill(CELL_STATES.unvisited);
+            this.visitedCount = 0;
+            this.appliedStep = -1;
+        }
+        
+        while (this.appliedStep < target) {
+            this.appliedStep++;
+            this.applyStep(this.appliedStep);
+        }
+    }
+    
+    /**
+     * Set the cells listed for a step under each state name to that state.
+     */
+    applyStep(step) {
+        const width = this.gridData.width;
+        ['visited', 'frontier', 'path'].forEach(name => {
+            const code = CELL_STATES[name];
+            const {coords, offsets} = this.steps[name];
+            for (let i = offsets[step]; i < offsets[step + 1]; i++) {
+                const index = coords[2 * i] * width + coords[2 * i + 1];
+                if (code === CELL_STATES.visited &&
+                    this.cellStates[index] !== CELL_STATES.visited) {
+                    this.visitRank[index] = this.visitedCount++;
+                }
+                this.cellStates[index] = code;
+            }
+        });
+    }
+    
     /**
      * Draw a single cell.
      */
-    drawCell(row, col, step) {
+    drawCell(row, col) {
         const ctx = this.ctx;
         const x = col * this.cellSize;
         const y = row * this.cellSize;
-        const coord = [row, col];
+        const index = row * this.gridData.width + col;
+        const state = this.cellStates[index];
         
         // Check if this is start or end
         if (this.gridData.start && 
@@ -90,18 +184,16 @@ class AlgorithmVisualizer {
             return;
         }
         
-        // Check state priority: path > frontier > visited > unvisited
-        if (step.path && this.isInArray(coord, step.path)) {
+        // Each cell holds one state: path, frontier, visited or unvisited
+        if (state === CELL_STATES.path) {
             this.drawPath(x, y);
-        } else if (this.isInArray(coord, step.frontier)) {
+        } else if (state === CELL_STATES.frontier) {
             ctx.fillStyle = this.colors.frontier;
             ctx.fillRect(x, y, this.cellSize, this.cellSize);
-        } else if (this.isInArray(coord, step.visited)) {
+        } else if (state === CELL_STATES.visited) {
             // Use gradient based on visit order for visual interest
-            const visitIndex = step.visited.findIndex(v => 
-                v[0] === row && v[1] === col
-            );
-            const alpha = Math.max(0.3, 1 - (visitIndex / step.visited.length) * 0.5);
+            const visitIndex = this.visitRank[index];
+            const alpha = Math.max(0.3, 1 - (visitIndex / this.visitedCount) * 0.5);
             ctx.fillStyle = this.colors.visited;
             ctx.globalAlpha = alpha;
             ctx.fillRect(x, y, this.cellSize, this.cellSize);
@@ -160,22 +252,11 @@ class AlgorithmVisualizer {
         ctx.shadowBlur = 0;
     }
     
-    /**
-     * Check if a coordinate is in an array.
-     */
-    isInArray(coord, array) {
-        if (!array) return false;
-        return array.some(item => item[0] === coord[0] && item[1] === coord[1]);
-    }
-    
     /**
      * Check if a position is an obstacle.
      */
     isObstacle(row, col) {
-        if (!this.gridData.obstacles) return false;
-        return this.gridData.obstacles.some(
-            obs => obs[0] === row && obs[1] === col
-        );
+        return this.obstacleMask[row * this.gridData.width + col] === 1;
     }
     
     /**
@@ -235,7 +316,7 @@ class SynchronizedVisualizer {
         
         // Find max steps across all algorithms
         this.maxSteps = Math.max(
-            ...this.comparisonData.algorithms.map(algo => algo.steps.length - 1)
+            ...this.comparisonData.algorithms.map(algo => algo.steps.count - 1)
         );
         
         // Create panel for each algorithm